@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
 """配置模块"""
-from .settings import settings, Settings
+from .settings import settings, Settings, reload_settings
 
-__all__ = ["settings", "Settings"]
+__all__ = ["settings", "Settings", "reload_settings"]
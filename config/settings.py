@@ -167,3 +167,21 @@ class Settings(BaseSettings):
 
 # 全局配置实例
 settings = Settings()
+
+
+def reload_settings(env_file: Optional[str] = None) -> Settings:
+    """
+    重新读取配置并原地更新全局实例
+    
+    其他模块持有的 settings 引用保持有效，无需重新导入
+    
+    Args:
+        env_file: 配置文件路径，为空时使用默认的 .env
+        
+    Returns:
+        Settings: 更新后的全局配置实例
+    """
+    fresh = Settings(_env_file=env_file) if env_file else Settings()
+    for name in Settings.model_fields:
+        setattr(settings, name, getattr(fresh, name))
+    return settings
@@ -1,7 +1,5 @@
 # -*- coding: utf-8 -*-
 """核心模块 - LLM客户端、嵌入模型、提示词模板、日志、异常处理"""
-from .llm import LLMClient, get_llm_client
-from .embeddings import EmbeddingClient, get_embedding_client
 from .prompts import PromptTemplates
 from .logger import (
     setup_logger,
@@ -68,3 +66,22 @@ __all__ = [
     "format_error_message",
     "get_user_friendly_message",
 ]
+
+# LLM / 嵌入客户端依赖 openai（连带 httpx、pydantic），首次访问时才导入，
+# 仅导入 core.history 等轻量模块时不必加载
+_LAZY_EXPORTS = {
+    "LLMClient": ".llm",
+    "get_llm_client": ".llm",
+    "EmbeddingClient": ".embeddings",
+    "get_embedding_client": ".embeddings",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -136,3 +136,9 @@ def get_embedding_client() -> EmbeddingClient:
         _embedding_client = EmbeddingClient()
     
     return _embedding_client
+
+
+def reset_embedding_client():
+    """丢弃已创建的客户端单例，下次获取时按当前配置重新创建（配置变更后调用）"""
+    global _embedding_client
+    _embedding_client = None
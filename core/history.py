@@ -146,6 +146,28 @@ class HistoryManager:
             logger.warning(f"Failed to fetch history: {e}")
             return []
 
+    def get_record_summaries(self, limit: int = 100, preview_chars: int = 100) -> List[Dict]:
+        """获取最近记录的列表摘要（仅 id、时间、类型与输出预览），不读取完整的输入/输出/报告"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT id, timestamp, action_type, substr(output_content, 1, ?) AS preview
+                FROM records 
+                ORDER BY timestamp DESC 
+                LIMIT ?
+            ''', (preview_chars, limit))
+            
+            rows = cursor.fetchall()
+            conn.close()
+            
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.warning(f"Failed to fetch history summaries: {e}")
+            return []
+
     def get_record_by_id(self, record_id: int) -> Optional[Dict]:
         """根据 ID 获取完整历史记录"""
         try:
@@ -318,3 +318,10 @@ def get_llm_client(use_backup: bool = False) -> LLMClient:
         if _llm_client is None:
             _llm_client = LLMClient()
         return _llm_client
+
+
+def reset_llm_client():
+    """丢弃已创建的客户端单例，下次获取时按当前配置重新创建（配置变更后调用）"""
+    global _llm_client, _backup_llm_client
+    _llm_client = None
+    _backup_llm_client = None
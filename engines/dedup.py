@@ -19,6 +19,9 @@ MAX_CHANGES_TO_REPORT = 5
 SENTENCE_MAX_LENGTH = 300  # 单句最大长度
 BATCH_SIZE = 3  # 批量处理句子数
 
+# 相似度计算用的词切分正则（预编译，避免每次调用重新查找缓存）
+WORD_PATTERN = re.compile(r'[\u4e00-\u9fff]+|[a-zA-Z]+')
+
 
 @dataclass
 class DedupResult:
@@ -395,12 +398,15 @@ class DedupEngine:
         """
         from difflib import SequenceMatcher
         
+        if text1 == text2:
+            return 1.0
+        
         # 字符级相似度
         char_sim = SequenceMatcher(None, text1, text2).ratio()
         
         # 词级相似度 (简单分词)
-        words1 = set(re.findall(r'[\u4e00-\u9fff]+|[a-zA-Z]+', text1))
-        words2 = set(re.findall(r'[\u4e00-\u9fff]+|[a-zA-Z]+', text2))
+        words1 = set(WORD_PATTERN.findall(text1))
+        words2 = set(WORD_PATTERN.findall(text2))
         
         if words1 and words2:
             intersection = len(words1 & words2)
@@ -4,11 +4,16 @@
 检测文本相似度，找出相似片段
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Set
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 import re
 
+# 预编译正则
+_PUNCT_PATTERN = re.compile(r'[^\u4e00-\u9fa5a-zA-Z0-9\s]')
+_CHINESE_PATTERN = re.compile(r'[\u4e00-\u9fa5]+')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
 
 @dataclass
 class SimilarityResult:
@@ -118,14 +123,15 @@ class SimilarityChecker:
         Returns:
             float: 相似度 0-1
         """
-        ngrams1 = set(self._get_ngrams(text1))
-        ngrams2 = set(self._get_ngrams(text2))
+        ngrams1 = self._get_ngram_set(text1)
+        ngrams2 = self._get_ngram_set(text2)
         
         if not ngrams1 or not ngrams2:
             return 0.0
         
+        # 集合交集在 C 层完成，并集大小由容斥得到，无需再构造并集
         intersection = len(ngrams1 & ngrams2)
-        union = len(ngrams1 | ngrams2)
+        union = len(ngrams1) + len(ngrams2) - intersection
         
         return intersection / union if union > 0 else 0.0
     
@@ -140,7 +146,7 @@ class SimilarityChecker:
             List[str]: 词列表
         """
         # 移除标点
-        text = re.sub(r'[^\u4e00-\u9fa5a-zA-Z0-9\s]', '', text)
+        text = _PUNCT_PATTERN.sub('', text)
         
         # 按空格分割（适用于英文）
         words = text.split()
@@ -148,7 +154,7 @@ class SimilarityChecker:
         # 对中文进行简单的双字切分
         chinese_words = []
         for word in words:
-            if re.match(r'[\u4e00-\u9fa5]+', word):
+            if _CHINESE_PATTERN.match(word):
                 # 中文，双字切分
                 for i in range(len(word) - 1):
                     chinese_words.append(word[i:i+2])
@@ -168,7 +174,7 @@ class SimilarityChecker:
             List[str]: N-gram 列表
         """
         # 移除空白
-        text = re.sub(r'\s+', '', text)
+        text = _WHITESPACE_PATTERN.sub('', text)
         
         if len(text) < self.ngram_size:
             return [text]
@@ -179,6 +185,24 @@ class SimilarityChecker:
         
         return ngrams
     
+    def _get_ngram_set(self, text: str) -> Set[str]:
+        """
+        获取 N-gram 集合（直接构造集合，不生成中间列表）
+        
+        Args:
+            text: 文本
+            
+        Returns:
+            Set[str]: N-gram 集合
+        """
+        text = _WHITESPACE_PATTERN.sub('', text)
+        n = self.ngram_size
+        
+        if len(text) < n:
+            return {text}
+        
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+    
     def _find_similar_segments(
         self,
         text1: str,
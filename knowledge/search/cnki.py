@@ -16,7 +16,8 @@ import re
 import time
 import random
 import urllib.parse
-import httpx
+
+from .http_client import get_http_client
 
 
 @dataclass
@@ -97,15 +98,15 @@ def _search_baidu_xueshu(query: str, limit: int) -> List[CNKIResult]:
     url = f"https://xueshu.baidu.com/s?wd={encoded_query}&ie=utf-8&tn=SE_baiduxueshu_c1gjeupa"
     
     try:
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            response = client.get(url, headers=headers)
-            response.raise_for_status()
-            
-            html = response.text
-            
-            # 解析搜索结果
-            results = _parse_baidu_xueshu_html(html, limit)
-            
+        client = get_http_client()
+        response = client.get(url, headers=headers, follow_redirects=True)
+        response.raise_for_status()
+        
+        html = response.text
+        
+        # 解析搜索结果
+        results = _parse_baidu_xueshu_html(html, limit)
+        
     except Exception as e:
         print(f"百度学术请求失败: {e}")
     
@@ -240,48 +241,48 @@ def _search_wanfang(query: str, limit: int) -> List[CNKIResult]:
     }
     
     try:
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            response = client.get(api_url, params=params, headers=headers)
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    items = data.get("hits", {}).get("hit", [])
-                    
-                    for item in items[:limit]:
-                        try:
-                            fields = item.get("fields", {})
-                            
-                            title = fields.get("title", [""])[0] if fields.get("title") else ""
-                            authors_list = fields.get("creator", [])
-                            authors = ", ".join(authors_list) if authors_list else ""
-                            
-                            abstract = fields.get("abstract", [""])[0] if fields.get("abstract") else ""
-                            year = fields.get("date", [""])[0][:4] if fields.get("date") else ""
-                            source = fields.get("journalName", [""])[0] if fields.get("journalName") else ""
-                            
-                            # 构建链接
-                            doc_id = item.get("id", "")
-                            link = f"https://d.wanfangdata.com.cn/periodical/{doc_id}" if doc_id else ""
-                            
-                            if title:
-                                results.append(CNKIResult(
-                                    title=title,
-                                    authors=authors,
-                                    year=year,
-                                    abstract=abstract,
-                                    link=link,
-                                    citations=0,
-                                    source=source or "万方数据",
-                                    database="Wanfang"
-                                ))
-                                
-                        except Exception:
-                            continue
+        client = get_http_client()
+        response = client.get(api_url, params=params, headers=headers, follow_redirects=True)
+        
+        if response.status_code == 200:
+            try:
+                data = response.json()
+                items = data.get("hits", {}).get("hit", [])
+                
+                for item in items[:limit]:
+                    try:
+                        fields = item.get("fields", {})
+                        
+                        title = fields.get("title", [""])[0] if fields.get("title") else ""
+                        authors_list = fields.get("creator", [])
+                        authors = ", ".join(authors_list) if authors_list else ""
+                        
+                        abstract = fields.get("abstract", [""])[0] if fields.get("abstract") else ""
+                        year = fields.get("date", [""])[0][:4] if fields.get("date") else ""
+                        source = fields.get("journalName", [""])[0] if fields.get("journalName") else ""
+                        
+                        # 构建链接
+                        doc_id = item.get("id", "")
+                        link = f"https://d.wanfangdata.com.cn/periodical/{doc_id}" if doc_id else ""
+                        
+                        if title:
+                            results.append(CNKIResult(
+                                title=title,
+                                authors=authors,
+                                year=year,
+                                abstract=abstract,
+                                link=link,
+                                citations=0,
+                                source=source or "万方数据",
+                                database="Wanfang"
+                            ))
                             
-                except Exception:
-                    pass
-                    
+                    except Exception:
+                        continue
+                        
+            except Exception:
+                pass
+                
     except Exception as e:
         print(f"万方数据请求失败: {e}")
     
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+学术搜索共享 HTTP 客户端
+各检索模块复用同一个连接池，同一主机的后续请求无需重新建立 TCP/TLS 连接
+"""
+
+import threading
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.Client] = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    获取共享的 httpx 客户端（线程安全，首次调用时创建）
+
+    Returns:
+        httpx.Client: 带连接池和连接重试的客户端
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=30,
+                    # 显式传入 transport 时客户端级的 limits 不生效，连接池上限需设在 transport 上；
+                    # 连接失败时自动重试（不重试已发出的请求）
+                    transport=httpx.HTTPTransport(
+                        retries=3,
+                        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                    ),
+                )
+    return _client
@@ -8,14 +8,15 @@
 2. Easy Scholar API（如可用）
 """
 
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
 
-@dataclass
+@dataclass(frozen=True)
 class JournalRank:
-    """期刊级别信息"""
+    """期刊级别信息（不可变：内置期刊表与查询缓存返回的是同一实例）"""
     name: str
     cssci: bool = False  # 是否CSSCI
     pku: bool = False    # 是否北大核心
@@ -143,9 +144,10 @@ ENGLISH_TOP_JOURNALS = {
 }
 
 
+@lru_cache(maxsize=4096)
 def check_journal_rank(journal_name: str) -> Optional[JournalRank]:
     """
-    查询期刊级别
+    查询期刊级别（结果缓存，同名期刊只做一次模糊匹配扫描）
     
     Args:
         journal_name: 期刊名称
@@ -294,6 +296,22 @@ def filter_by_quality(papers: List[Dict],
     return filtered
 
 
+def get_rank_fields(journal_name: str) -> Tuple[str, str]:
+    """
+    获取期刊的级别信息字符串和学科分类
+    
+    Args:
+        journal_name: 期刊名称
+        
+    Returns:
+        Tuple[str, str]: (级别信息, 学科分类)，未收录的期刊返回空字符串
+    """
+    rank = check_journal_rank(journal_name)
+    if rank:
+        return format_rank_info(rank), rank.category
+    return "", ""
+
+
 def enrich_with_rank_info(papers: List[Dict]) -> List[Dict]:
     """
     为论文添加期刊级别信息
@@ -305,14 +323,6 @@ def enrich_with_rank_info(papers: List[Dict]) -> List[Dict]:
         List[Dict]: 添加了级别信息的论文列表
     """
     for paper in papers:
-        journal = paper.get("journal", "")
-        rank = check_journal_rank(journal)
-        
-        if rank:
-            paper["rank_info"] = format_rank_info(rank)
-            paper["journal_category"] = rank.category
-        else:
-            paper["rank_info"] = ""
-            paper["journal_category"] = ""
+        paper["rank_info"], paper["journal_category"] = get_rank_fields(paper.get("journal", ""))
     
     return papers
\ No newline at end of file
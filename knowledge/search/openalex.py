@@ -11,6 +11,8 @@ from dataclasses import dataclass
 import httpx
 import re
 
+from .http_client import get_http_client
+
 
 @dataclass
 class OpenAlexResult:
@@ -27,6 +29,13 @@ class OpenAlexResult:
     open_access: bool  # 是否开放获取
 
 
+# 仅请求解析所需的字段，显著减小响应体积
+SEARCH_SELECT_FIELDS = ",".join([
+    "id", "doi", "title", "publication_year", "authorships", "abstract_inverted_index",
+    "primary_location", "cited_by_count", "open_access",
+])
+
+
 def search_openalex(
     query: str,
     limit: int = 10,
@@ -72,6 +81,7 @@ def search_openalex(
         "search": query,
         "per_page": min(limit, 200),
         "sort": "cited_by_count:desc",  # 按引用数排序
+        "select": SEARCH_SELECT_FIELDS,
         "mailto": "econpaper@example.com"  # 礼貌请求，获得更高速率限制
     }
     
@@ -83,7 +93,7 @@ def search_openalex(
     }
     
     try:
-        response = httpx.get(
+        response = get_http_client().get(
             api_url,
             params=params,
             headers=headers,
@@ -230,7 +240,7 @@ def get_work_details(openalex_id: str) -> Optional[OpenAlexResult]:
     }
     
     try:
-        response = httpx.get(
+        response = get_http_client().get(
             api_url,
             params=params,
             headers=headers,
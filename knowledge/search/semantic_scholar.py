@@ -10,6 +10,8 @@ from dataclasses import dataclass
 import httpx
 import time
 
+from .http_client import get_http_client
+
 
 @dataclass
 class SemanticScholarResult:
@@ -68,7 +70,7 @@ def search_semantic_scholar(
     }
     
     try:
-        response = httpx.get(
+        response = get_http_client().get(
             api_url, 
             params=params, 
             headers=headers, 
@@ -176,7 +178,7 @@ def get_paper_details(paper_id: str) -> Optional[SemanticScholarResult]:
     }
     
     try:
-        response = httpx.get(
+        response = get_http_client().get(
             api_url,
             params=params,
             headers=headers,
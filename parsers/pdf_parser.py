@@ -4,7 +4,7 @@ PDF解析模块
 使用 PyMuPDF 解析 PDF 文件，提取文本内容
 """
 
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterator
 
 # 安全导入 PyMuPDF
 try:
@@ -78,6 +78,30 @@ class PDFParser:
         except Exception as e:
             raise RuntimeError(f"PDF 分页解析失败: {str(e)}")
     
+    def iter_pages(self, file_path: str) -> Iterator[str]:
+        """
+        逐页流式解析 PDF 文件，每次只提取一页文本
+        
+        Args:
+            file_path: PDF 文件路径
+            
+        Yields:
+            str: 单页文本内容
+        """
+        if not FITZ_AVAILABLE or fitz is None:
+            raise RuntimeError("PDF 解析需要安装 PyMuPDF: pip install PyMuPDF")
+        
+        try:
+            doc = fitz.open(file_path)
+        except Exception as e:
+            raise RuntimeError(f"PDF 解析失败: {str(e)}")
+        
+        try:
+            for page_num in range(len(doc)):
+                yield doc.load_page(page_num).get_text()
+        finally:
+            doc.close()
+    
     def parse_with_metadata(self, file_path: str) -> Dict:
         """
         解析 PDF 文件并提取元数据
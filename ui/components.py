@@ -7,10 +7,43 @@ v2.5 新增：流式输出、精确进度条
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-from typing import Optional, Callable, List, Tuple, Generator
+import tkinter.font as tkfont
+from typing import Any, Optional, Callable, List, Tuple, Generator
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import queue
 import time
+import re
+
+
+# 词数统计用的预编译正则（避免 split() 构造中间列表）
+_WORD_RE = re.compile(r"\S+")
+
+# 分段填充长文本时每次插入的字符数
+PROGRESSIVE_CHUNK_CHARS = 4096
+
+# 可点击控件的绑定标签，手型光标由类级绑定统一设置
+CLICKABLE_TAG = "Clickable"
+_clickable_bound = False
+
+
+def _on_clickable_enter(event):
+    """首次悬停时为可点击控件设置手型光标（光标仅在指针位于控件上时生效，无需离开时复位）"""
+    widget = event.widget
+    if not widget.cget("cursor"):
+        widget.configure(cursor="hand2")
+
+
+def make_clickable(widget):
+    """将控件标记为可点击，返回控件本身以便链式调用"""
+    global _clickable_bound
+    if not _clickable_bound:
+        widget.bind_class(CLICKABLE_TAG, "<Enter>", _on_clickable_enter, add="+")
+        _clickable_bound = True
+    tags = widget.bindtags()
+    if CLICKABLE_TAG not in tags:
+        widget.bindtags((CLICKABLE_TAG,) + tags)
+    return widget
 
 
 class ModernStyle:
@@ -122,6 +155,19 @@ class ModernStyle:
     FONT_SIZE_SM = 11
     FONT_SIZE_XS = 10
     
+    # 命名字体（由 create_fonts 在 Tk 根窗口创建后初始化，Tk 内部按名称缓存）
+    FONT_XS = None
+    FONT_SM = None
+    FONT_MD = None
+    FONT_LG = None
+    FONT_XS_BOLD = None
+    FONT_SM_BOLD = None
+    FONT_MD_BOLD = None
+    FONT_LG_BOLD = None
+    FONT_XL_BOLD = None
+    FONT_XXL_BOLD = None
+    FONT_ICON = None  # 导航与对话框中的图标字号
+    
     # 间距
     PADDING_XL = 30
     PADDING_LG = 20
@@ -139,9 +185,31 @@ class ModernStyle:
     TAB_BORDER = "#E2E8F0"
     TAB_HOVER_BG = "#E2E8F0"
     
+    @classmethod
+    def create_fonts(cls, root):
+        """创建常用命名字体，控件直接引用字体名，避免每次创建控件都重新解析字体描述"""
+        if cls.FONT_MD is not None:
+            return
+        
+        def make(size: int, weight: str = "normal") -> tkfont.Font:
+            return tkfont.Font(root=root, family=cls.FONT_FAMILY, size=size, weight=weight)
+        
+        cls.FONT_XS = make(cls.FONT_SIZE_XS)
+        cls.FONT_SM = make(cls.FONT_SIZE_SM)
+        cls.FONT_MD = make(cls.FONT_SIZE_MD)
+        cls.FONT_LG = make(cls.FONT_SIZE_LG)
+        cls.FONT_XS_BOLD = make(cls.FONT_SIZE_XS, "bold")
+        cls.FONT_SM_BOLD = make(cls.FONT_SIZE_SM, "bold")
+        cls.FONT_MD_BOLD = make(cls.FONT_SIZE_MD, "bold")
+        cls.FONT_LG_BOLD = make(cls.FONT_SIZE_LG, "bold")
+        cls.FONT_XL_BOLD = make(cls.FONT_SIZE_XL, "bold")
+        cls.FONT_XXL_BOLD = make(cls.FONT_SIZE_XXL, "bold")
+        cls.FONT_ICON = make(16)
+    
     @classmethod
     def configure_styles(cls, root):
         """配置 ttk 样式"""
+        cls.create_fonts(root)
         style = ttk.Style(root)
         
         try:
@@ -151,7 +219,7 @@ class ModernStyle:
         
         # 全局配置
         style.configure(".", 
-            font=(cls.FONT_FAMILY, cls.FONT_SIZE_SM),
+            font=cls.FONT_SM,
             background=cls.BG_MAIN
         )
         
@@ -161,7 +229,7 @@ class ModernStyle:
             foreground=cls.TEXT_LIGHT,
             padding=(20, 12),
             borderwidth=0,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZE_SM, "bold")
+            font=cls.FONT_SM_BOLD
         )
         style.map("Primary.TButton",
             background=[("active", cls.PRIMARY_DARK), ("pressed", cls.PRIMARY_DARK)]
@@ -184,7 +252,7 @@ class ModernStyle:
             bordercolor=cls.BORDER,
             arrowcolor=cls.TEXT_SECONDARY,
             padding=8,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZE_SM)
+            font=cls.FONT_SM
         )
         style.map("TCombobox",
             fieldbackground=[("readonly", cls.BG_INPUT)],
@@ -201,7 +269,7 @@ class ModernStyle:
             background=cls.TAB_BG,
             foreground=cls.TEXT_SECONDARY,
             padding=(16, 10),
-            font=(cls.FONT_FAMILY, cls.FONT_SIZE_SM),
+            font=cls.FONT_SM,
             borderwidth=0
         )
         style.map("Modern.TNotebook.Tab",
@@ -217,12 +285,12 @@ class ModernStyle:
             foreground=cls.TEXT_PRIMARY,
             rowheight=35,
             borderwidth=0,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZE_SM)
+            font=cls.FONT_SM
         )
         style.configure("Treeview.Heading",
             background=cls.BG_SIDEBAR,
             foreground=cls.TEXT_SECONDARY,
-            font=(cls.FONT_FAMILY, cls.FONT_SIZE_SM, "bold"),
+            font=cls.FONT_SM_BOLD,
             borderwidth=0
         )
         style.map("Treeview",
@@ -285,7 +353,7 @@ class Tooltip:
             text=self.text,
             bg="#1F2937",
             fg=ModernStyle.TEXT_LIGHT,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             padx=8,
             pady=4,
             wraplength=250,
@@ -330,22 +398,21 @@ class AnimatedProgressBar:
         self.label = tk.Label(
             self.status_row,
             text=text,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_SECONDARY
         )
         self.label.pack(side=tk.LEFT)
         
         # 取消按钮
-        self.cancel_btn = tk.Label(
+        self.cancel_btn = make_clickable(tk.Label(
             self.status_row,
             text="✕ 取消任务",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED,
-            cursor="hand2",
             padx=10
-        )
+        ))
         self.cancel_btn.bind("<Button-1>", self._on_cancel)
         self.cancel_btn.bind("<Enter>", lambda e: self.cancel_btn.config(fg=ModernStyle.ERROR))
         self.cancel_btn.bind("<Leave>", lambda e: self.cancel_btn.config(fg=ModernStyle.TEXT_MUTED))
@@ -474,7 +541,7 @@ class PreciseProgressBar(tk.Frame):
         self.label = tk.Label(
             self.status_row,
             text=text,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_SECONDARY
         )
@@ -484,22 +551,21 @@ class PreciseProgressBar(tk.Frame):
         self.percent_label = tk.Label(
             self.status_row,
             text="0%",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM, "bold"),
+            font=ModernStyle.FONT_SM_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.PRIMARY
         )
         self.percent_label.pack(side=tk.LEFT, padx=(10, 0))
         
         # 取消按钮
-        self.cancel_btn = tk.Label(
+        self.cancel_btn = make_clickable(tk.Label(
             self.status_row,
             text="✕ 取消",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED,
-            cursor="hand2",
             padx=10
-        )
+        ))
         self.cancel_btn.bind("<Button-1>", self._on_cancel)
         self.cancel_btn.bind("<Enter>", lambda e: self.cancel_btn.config(fg=ModernStyle.ERROR))
         self.cancel_btn.bind("<Leave>", lambda e: self.cancel_btn.config(fg=ModernStyle.TEXT_MUTED))
@@ -522,7 +588,7 @@ class PreciseProgressBar(tk.Frame):
         self.detail_label = tk.Label(
             self.detail_row,
             text="",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED
         )
@@ -532,7 +598,7 @@ class PreciseProgressBar(tk.Frame):
         self.eta_label = tk.Label(
             self.detail_row,
             text="",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED
         )
@@ -689,6 +755,9 @@ class StreamingTextOutput(tk.Frame):
         self._streaming = False
         self._buffer = []
         self._typing_job = None
+        self._pending_chunks: List[str] = []  # 待刷新的文本块
+        self._flush_job = None
+        self._fill_job = None  # 分段填充长文本的后续任务
         
         # 边框容器
         self.border_frame = tk.Frame(self, bg=ModernStyle.BORDER, padx=1, pady=1)
@@ -703,7 +772,7 @@ class StreamingTextOutput(tk.Frame):
         self.status_label = tk.Label(
             self.toolbar,
             text="",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED,
             padx=10
@@ -714,7 +783,7 @@ class StreamingTextOutput(tk.Frame):
         self.count_label = tk.Label(
             self.toolbar,
             text="0 字",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED,
             padx=10
@@ -724,7 +793,7 @@ class StreamingTextOutput(tk.Frame):
         # 文本框
         self.text = scrolledtext.ScrolledText(
             self.border_frame,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             wrap=tk.WORD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
@@ -770,8 +839,25 @@ class StreamingTextOutput(tk.Frame):
             if self._typing_job is None:
                 self._type_next_char()
         else:
-            # 直接追加
-            self._append_text(chunk)
+            # 先缓冲，空闲时一次性写入，避免每块都切换 state
+            self._pending_chunks.append(chunk)
+            if self._flush_job is None:
+                self._flush_job = self.after_idle(self._flush_pending)
+    
+    def _flush_pending(self):
+        """将缓冲的文本块合并后一次性写入文本框"""
+        self._flush_job = None
+        if self._pending_chunks:
+            joined = "".join(self._pending_chunks)
+            self._pending_chunks = []
+            self._append_text(joined)
+    
+    def _cancel_flush(self):
+        """取消待执行的刷新并丢弃缓冲"""
+        if self._flush_job:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        self._pending_chunks = []
     
     def _type_next_char(self):
         """打字机效果：显示下一个字符"""
@@ -800,6 +886,11 @@ class StreamingTextOutput(tk.Frame):
         """结束流式接收"""
         self._streaming = False
         
+        # 写入尚未刷新的文本块
+        if self._flush_job:
+            self.after_cancel(self._flush_job)
+        self._flush_pending()
+        
         # 清空缓冲区（如果使用打字机效果）
         if self._buffer:
             remaining = "".join(self._buffer)
@@ -820,21 +911,51 @@ class StreamingTextOutput(tk.Frame):
         # 3秒后恢复边框颜色
         self.after(3000, lambda: self.border_frame.config(bg=ModernStyle.BORDER))
     
-    def set_content(self, content: str, tag: Optional[str] = None):
-        """直接设置内容（非流式）"""
+    def set_content(self, content: str, tag: Optional[str] = None, progressive: bool = False):
+        """直接设置内容（非流式）
+        
+        Args:
+            progressive: 为 True 时先插入开头一段，其余部分在空闲时分段追加，长文本不阻塞界面
+        """
         self._streaming = False
+        self._cancel_flush()
+        self._cancel_fill()
+        head = content[:PROGRESSIVE_CHUNK_CHARS] if progressive else content
         self.text.config(state=tk.NORMAL)
         self.text.delete("1.0", tk.END)
         if tag:
-            self.text.insert("1.0", content, tag)
+            self.text.insert("1.0", head, tag)
         else:
-            self.text.insert("1.0", content)
+            self.text.insert("1.0", head)
         self.text.config(state=tk.DISABLED)
+        if len(head) < len(content):
+            self._fill_job = self.after_idle(self._fill_rest, content, len(head), tag)
         
         self.count_label.config(text=f"{len(content)} 字")
         self.status_label.config(text="")
         self.border_frame.config(bg=ModernStyle.BORDER)
     
+    def _fill_rest(self, content: str, offset: int, tag: Optional[str]):
+        """分段填充：追加下一段文本，未完成时在下一个空闲时段继续"""
+        chunk = content[offset:offset + PROGRESSIVE_CHUNK_CHARS]
+        self.text.config(state=tk.NORMAL)
+        if tag:
+            self.text.insert(tk.END, chunk, tag)
+        else:
+            self.text.insert(tk.END, chunk)
+        self.text.config(state=tk.DISABLED)
+        offset += len(chunk)
+        if offset < len(content):
+            self._fill_job = self.after_idle(self._fill_rest, content, offset, tag)
+        else:
+            self._fill_job = None
+    
+    def _cancel_fill(self):
+        """取消未完成的分段填充"""
+        if self._fill_job:
+            self.after_cancel(self._fill_job)
+            self._fill_job = None
+    
     def get_content(self) -> str:
         """获取内容"""
         return self.text.get("1.0", tk.END).strip()
@@ -843,6 +964,8 @@ class StreamingTextOutput(tk.Frame):
         """清空内容"""
         self._streaming = False
         self._buffer = []
+        self._cancel_flush()
+        self._cancel_fill()
         if self._typing_job:
             self.after_cancel(self._typing_job)
             self._typing_job = None
@@ -859,7 +982,8 @@ class StreamingTextOutput(tk.Frame):
         self,
         generator: Generator[str, None, None],
         on_complete: Optional[Callable[[str], None]] = None,
-        on_error: Optional[Callable[[Exception], None]] = None
+        on_error: Optional[Callable[[Exception], None]] = None,
+        runner: Optional[Callable[[Callable[[], None]], Any]] = None
     ):
         """
         从生成器流式接收内容
@@ -868,9 +992,22 @@ class StreamingTextOutput(tk.Frame):
             generator: 文本生成器
             on_complete: 完成回调
             on_error: 错误回调
+            runner: 后台执行器（如 TaskManager.run），为空时新建守护线程
         """
         self.start_streaming()
         
+        # 工作线程产生的文本块先在此合并，主线程每次取走全部，
+        # 只有缓冲由空变非空时才投递一次回调，避免每个 token 一次 Tk 事件
+        pending: List[str] = []
+        pending_lock = threading.Lock()
+        
+        def flush_pending():
+            with pending_lock:
+                chunks = pending[:]
+                pending.clear()
+            if chunks:
+                self.append_chunk("".join(chunks))
+        
         def stream_thread():
             full_content: List[str] = []
             try:
@@ -878,7 +1015,11 @@ class StreamingTextOutput(tk.Frame):
                     full_content.append(chunk)
                     # 线程安全更新UI - 修复: 添加组件存在性检查防止销毁后调用
                     if self.winfo_exists():
-                        self.after(0, lambda c=chunk: self.append_chunk(c))
+                        with pending_lock:
+                            schedule = not pending
+                            pending.append(chunk)
+                        if schedule:
+                            self.after(0, flush_pending)
                     else:
                         break  # 组件已销毁，停止处理
                 
@@ -899,8 +1040,11 @@ class StreamingTextOutput(tk.Frame):
                         error = e
                         self.after(0, lambda: error_callback(error))
         
-        thread = threading.Thread(target=stream_thread, daemon=True)
-        thread.start()
+        if runner is not None:
+            runner(stream_thread)
+        else:
+            thread = threading.Thread(target=stream_thread, daemon=True)
+            thread.start()
 
 
 class ModernButton(tk.Canvas):
@@ -944,13 +1088,14 @@ class ModernButton(tk.Canvas):
         self._draw_button()
         
         if not disabled:
+            make_clickable(self)
             self.bind("<Enter>", self._on_enter)
             self.bind("<Leave>", self._on_leave)
             self.bind("<Button-1>", self._on_click)
             self.bind("<ButtonRelease-1>", self._on_release)
         else:
             self._current_bg = ModernStyle.BG_DISABLED
-            self._draw_button()
+            self.itemconfigure(self._shape_id, fill=self._current_bg)
         
         # 添加工具提示
         if tooltip:
@@ -960,38 +1105,42 @@ class ModernButton(tk.Canvas):
         """绘制圆角按钮"""
         self.delete("all")
         r = 8  # 圆角半径
-        
-        # 绘制圆角矩形
-        self.create_arc(0, 0, r*2, r*2, start=90, extent=90, fill=self._current_bg, outline="")
-        self.create_arc(self.width-r*2, 0, self.width, r*2, start=0, extent=90, fill=self._current_bg, outline="")
-        self.create_arc(0, self.height-r*2, r*2, self.height, start=180, extent=90, fill=self._current_bg, outline="")
-        self.create_arc(self.width-r*2, self.height-r*2, self.width, self.height, start=270, extent=90, fill=self._current_bg, outline="")
-        
-        self.create_rectangle(r, 0, self.width-r, self.height, fill=self._current_bg, outline="")
-        self.create_rectangle(0, r, self.width, self.height-r, fill=self._current_bg, outline="")
+        x1, y1, x2, y2 = 0, 0, self.width, self.height
+        
+        # 单个平滑多边形绘制圆角矩形
+        self._shape_id = self.create_polygon(
+            [x1+r, y1, x2-r, y1, x2, y1, x2, y1+r,
+             x2, y2-r, x2, y2, x2-r, y2, x1+r, y2,
+             x1, y2, x1, y2-r, x1, y1+r, x1, y1],
+            smooth=True,
+            fill=self._current_bg,
+            outline=""
+        )
         
         # 绘制文本
-        text_color = ModernStyle.TEXT_DISABLED if self.disabled else self.text_color
-        self.create_text(
+        self._text_id = self.create_text(
             self.width/2, self.height/2,
             text=self.text,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM, "bold"),
-            fill=text_color
+            font=ModernStyle.FONT_SM_BOLD,
+            fill=self._text_fill()
         )
     
+    def _text_fill(self) -> str:
+        """当前状态下的文字颜色"""
+        return ModernStyle.TEXT_DISABLED if self.disabled else self.text_color
+    
     def _animate_color(self, target_color: str, steps: int = 6):
         """平滑颜色过渡动画"""
         if self._animation_id:
             self.after_cancel(self._animation_id)
         
-        # 简化动画，直接设置目标颜色
+        # 简化动画，直接设置目标颜色（仅更新填充色，无需重绘）
         self._current_bg = target_color
-        self._draw_button()
+        self.itemconfigure(self._shape_id, fill=target_color)
     
     def _on_enter(self, event):
         if not self.disabled:
             self._animate_color(self.hover_color)
-            self.config(cursor="hand2")
     
     def _on_leave(self, event):
         if not self.disabled and not self._is_pressed:
@@ -1020,16 +1169,18 @@ class ModernButton(tk.Canvas):
             self.unbind("<ButtonRelease-1>")
         else:
             self._current_bg = self.bg_color
+            make_clickable(self)
             self.bind("<Enter>", self._on_enter)
             self.bind("<Leave>", self._on_leave)
             self.bind("<Button-1>", self._on_click)
             self.bind("<ButtonRelease-1>", self._on_release)
-        self._draw_button()
+        self.itemconfigure(self._shape_id, fill=self._current_bg)
+        self.itemconfigure(self._text_id, fill=self._text_fill())
     
     def set_text(self, text: str):
         """更新按钮文字"""
         self.text = text
-        self._draw_button()
+        self.itemconfigure(self._text_id, text=text)
 
 
 class PlaceholderEntry(tk.Entry):
@@ -1115,7 +1266,7 @@ class StatusBar:
         self.status_label = tk.Label(
             self.frame,
             text="就绪",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED,
             padx=15
@@ -1126,7 +1277,7 @@ class StatusBar:
         self.info_label = tk.Label(
             self.frame,
             text="",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED,
             padx=15
@@ -1151,13 +1302,20 @@ class StatusBar:
 
 
 class TaskManager:
-    """任务管理器 - 管理后台任务的执行和取消"""
+    """任务管理器 - 管理后台任务的执行和取消
     
-    def __init__(self, safe_update_func: Callable):
+    任务在有界线程池中执行，复用工作线程并限制并发数量。
+    长时间占用线程的流式生成和文件预解析各用独立的线程池，不挤占普通任务的工作线程。
+    """
+    
+    def __init__(self, safe_update_func: Callable, max_workers: int = 4):
         self.safe_update = safe_update_func
         self.active_tasks = {}
         self._task_counter = 0
         self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ui-worker")
+        self._stream_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ui-stream")
+        self._background_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ui-background")
     
     def submit(
         self, 
@@ -1165,11 +1323,15 @@ class TaskManager:
         on_complete: Optional[Callable] = None,
         on_error: Optional[Callable] = None,
         on_progress: Optional[Callable] = None,
-        task_name: str = "task"
+        task_name: str = "task",
+        background: bool = False
     ) -> str:
         """
         提交任务
         
+        Args:
+            background: 为 True 时在后台线程池执行（用于预解析等非用户直接等待的工作）
+        
         Returns:
             str: 任务ID，可用于取消任务
         """
@@ -1203,12 +1365,12 @@ class TaskManager:
                         if cb: cb(err)
                     self.safe_update(do_error)
             finally:
+                # 结束的任务移出登记表，避免长时间运行后不断累积
                 with self._lock:
-                    if task_id in self.active_tasks:
-                        self.active_tasks[task_id]["status"] = "completed"
+                    self.active_tasks.pop(task_id, None)
         
-        thread = threading.Thread(target=wrapper, daemon=True)
-        thread.start()
+        executor = self._background_executor if background else self._executor
+        executor.submit(wrapper)
         
         return task_id
     
@@ -1235,6 +1397,20 @@ class TaskManager:
                 task_id in self.active_tasks and 
                 self.active_tasks[task_id]["status"] == "running"
             )
+    
+    def has_active(self) -> bool:
+        """是否有尚未结束的任务"""
+        return bool(self.active_tasks)
+    
+    def run(self, func: Callable[[], Any]):
+        """在流式线程池中直接执行函数（不登记任务、不回调），用于自行管理结果的后台工作"""
+        return self._stream_executor.submit(func)
+    
+    def shutdown(self):
+        """取消所有任务并关闭线程池（不等待正在执行的任务）"""
+        self.cancel_all()
+        for executor in (self._executor, self._stream_executor, self._background_executor):
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 class TextInputWithCount(tk.Frame):
@@ -1254,6 +1430,7 @@ class TextInputWithCount(tk.Frame):
         self.show_count = show_count
         self._has_placeholder = False
         self.max_chars = kwargs.get('max_chars', 0)
+        self._count_job = None  # 防抖中的字数统计任务
         
         # 边框容器
         self.border_frame = tk.Frame(self, bg=ModernStyle.BORDER, padx=1, pady=1)
@@ -1262,7 +1439,7 @@ class TextInputWithCount(tk.Frame):
         # 文本框
         self.text = scrolledtext.ScrolledText(
             self.border_frame,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             wrap=tk.WORD,
             bg=ModernStyle.BG_INPUT,
             fg=ModernStyle.TEXT_PRIMARY,
@@ -1279,16 +1456,15 @@ class TextInputWithCount(tk.Frame):
         self.text.pack(fill=tk.BOTH, expand=True)
 
         # 右上角清除按钮
-        self.clear_btn = tk.Label(
+        self.clear_btn = make_clickable(tk.Label(
             self.text,
             text="✕",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_INPUT,
             fg=ModernStyle.TEXT_MUTED,
-            cursor="hand2",
             padx=2,
             pady=2
-        )
+        ))
         self.clear_btn.place(relx=1.0, x=-20, y=5, anchor="ne")
         self.clear_btn.bind("<Button-1>", lambda e: self.clear())
         self.clear_btn.bind("<Enter>", lambda e: self.clear_btn.config(fg=ModernStyle.ERROR))
@@ -1304,7 +1480,7 @@ class TextInputWithCount(tk.Frame):
             self.count_label = tk.Label(
                 self,
                 text="字数: 0",
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+                font=ModernStyle.FONT_XS,
                 bg=ModernStyle.BG_MAIN,
                 fg=ModernStyle.TEXT_MUTED,
                 anchor="e"
@@ -1312,8 +1488,8 @@ class TextInputWithCount(tk.Frame):
             self.count_label.pack(fill=tk.X, pady=(3, 0))
             
             # 绑定文本变化事件
-            self.text.bind("<KeyRelease>", self._update_count)
-            self.text.bind("<<Paste>>", lambda e: self.after(10, self._update_count))
+            self.text.bind("<KeyRelease>", self._schedule_count)
+            self.text.bind("<<Paste>>", self._schedule_count)
         
         # 占位符处理
         if placeholder:
@@ -1342,15 +1518,24 @@ class TextInputWithCount(tk.Frame):
         if not content and self.placeholder:
             self._show_placeholder()
     
+    def _schedule_count(self, event=None):
+        """防抖：连续输入或粘贴时只在停顿 150ms 后统计一次，避免大段文本反复全量计数"""
+        if self._count_job is not None:
+            self.after_cancel(self._count_job)
+        self._count_job = self.after(150, self._update_count)
+    
     def _update_count(self, event=None):
         """更新字数统计"""
+        if self._count_job is not None:
+            self.after_cancel(self._count_job)
+            self._count_job = None
         if self._has_placeholder:
             self.count_label.config(text="字数: 0")
             return
         
         content = self.text.get("1.0", tk.END).strip()
         char_count = len(content)
-        word_count = len(content.split()) if content else 0
+        word_count = sum(1 for _ in _WORD_RE.finditer(content))
         
         count_text = f"字数: {char_count}"
         if self.max_chars > 0:
@@ -1365,11 +1550,13 @@ class TextInputWithCount(tk.Frame):
         count_text += f" | 词数: {word_count}"
         self.count_label.config(text=count_text)
     
-    def get_content(self) -> str:
-        """获取内容"""
+    def get_content(self, strip: bool = True) -> str:
+        """获取内容（strip=False 时返回原始文本，可把去空白的开销留给工作线程）"""
         if self._has_placeholder:
             return ""
-        return self.text.get("1.0", tk.END).strip()
+        # "end-1c" 排除 Text 末尾自动追加的换行
+        text = self.text.get("1.0", "end-1c")
+        return text.strip() if strip else text
     
     def set_content(self, content: str, highlight: bool = False):
         """设置内容"""
@@ -1429,7 +1616,7 @@ class TextOutputBox(tk.Frame):
         # 文本框
         self.text = scrolledtext.ScrolledText(
             self.border_frame,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             wrap=tk.WORD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
@@ -1507,20 +1694,19 @@ class NotificationBanner:
         tk.Label(
             self.current_banner,
             text=f"{icon} {message}",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=bg_color,
             fg=text_color
         ).pack(side=tk.LEFT)
         
         # 关闭按钮
-        close_btn = tk.Label(
+        close_btn = make_clickable(tk.Label(
             self.current_banner,
             text="✕",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=bg_color,
-            fg=text_color,
-            cursor="hand2"
-        )
+            fg=text_color
+        ))
         close_btn.pack(side=tk.RIGHT)
         close_btn.bind("<Button-1>", lambda e: self.hide())
         
@@ -1582,7 +1768,7 @@ class KeyboardShortcuts:
             lbl = tk.Label(
                 hint_frame,
                 text=f" {key} ",
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS, "bold"),
+                font=ModernStyle.FONT_XS_BOLD,
                 bg=ModernStyle.BG_SECONDARY,
                 fg=ModernStyle.TEXT_SECONDARY,
                 relief="flat",
@@ -1593,7 +1779,7 @@ class KeyboardShortcuts:
             tk.Label(
                 hint_frame,
                 text=desc,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+                font=ModernStyle.FONT_XS,
                 bg=ModernStyle.BG_MAIN,
                 fg=ModernStyle.TEXT_MUTED
             ).pack(side=tk.LEFT)
@@ -1634,7 +1820,7 @@ class ConfirmDialog:
         tk.Label(
             content,
             text=message,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY,
             wraplength=340,
@@ -1660,17 +1846,16 @@ class ConfirmDialog:
             height=38
         ).pack(side=tk.LEFT)
         
-        tk.Button(
+        make_clickable(tk.Button(
             btn_frame,
             text=cancel_text,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_SECONDARY,
             bd=0,
             padx=20,
             pady=8,
-            cursor="hand2",
             command=on_cancel
-        ).pack(side=tk.LEFT, padx=15)
+        )).pack(side=tk.LEFT, padx=15)
         
         dialog.wait_window()
         return result[0]
@@ -1737,21 +1922,20 @@ class DualOutputFrame(tk.Frame):
         tk.Label(
             toolbar,
             text="💡 此处显示纯净的处理结果，可直接复制使用",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED
         ).pack(side=tk.LEFT)
         
         # 复制按钮
-        copy_btn = tk.Label(
+        copy_btn = make_clickable(tk.Label(
             toolbar,
             text="📋 复制全部",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.PRIMARY,
-            cursor="hand2",
             padx=10
-        )
+        ))
         copy_btn.pack(side=tk.RIGHT)
         copy_btn.bind("<Button-1>", lambda e: self._copy_content())
         copy_btn.bind("<Enter>", lambda e: copy_btn.config(fg=ModernStyle.PRIMARY_DARK))
@@ -1770,21 +1954,20 @@ class DualOutputFrame(tk.Frame):
         tk.Label(
             toolbar,
             text="📈 此处显示 AI 分析诊断、评分建议等详细报告",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED
         ).pack(side=tk.LEFT)
         
         # 导出按钮
-        export_btn = tk.Label(
+        export_btn = make_clickable(tk.Label(
             toolbar,
             text="📥 导出报告",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.INFO,
-            cursor="hand2",
             padx=10
-        )
+        ))
         export_btn.pack(side=tk.RIGHT)
         export_btn.bind("<Button-1>", lambda e: self._export_report())
         export_btn.bind("<Enter>", lambda e: export_btn.config(fg=ModernStyle.PRIMARY_DARK))
@@ -1807,7 +1990,7 @@ class DualOutputFrame(tk.Frame):
         self.stats_label = tk.Label(
             self.action_bar,
             text="",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED
         )
@@ -1872,7 +2055,14 @@ class DualOutputFrame(tk.Frame):
                 with open(file_path, "w", encoding="utf-8") as f:
                     f.write(self._report)
     
-    def set_content(self, content: str, report: str = "", diff_mode: bool = False, old_content: str = ""):
+    def set_content(
+        self,
+        content: str,
+        report: str = "",
+        diff_mode: bool = False,
+        old_content: str = "",
+        progressive: bool = False
+    ):
         """设置输出内容
         
         Args:
@@ -1880,6 +2070,7 @@ class DualOutputFrame(tk.Frame):
             report: 分析报告（诊断、建议等）
             diff_mode: 是否启用差异高亮模式
             old_content: 差异对比的原文
+            progressive: 长文本分段填充，先显示开头部分
         """
         self._content = content
         self._report = report
@@ -1887,9 +2078,9 @@ class DualOutputFrame(tk.Frame):
         if diff_mode and old_content:
             self._display_diff(old_content, content)
         else:
-            self.content_output.set_content(content)
+            self.content_output.set_content(content, progressive=progressive)
             
-        self.report_output.set_content(report if report else "暂无分析报告")
+        self.report_output.set_content(report if report else "暂无分析报告", progressive=progressive)
         
         # 更新统计信息
         if hasattr(self, 'stats_label'):
@@ -1905,6 +2096,20 @@ class DualOutputFrame(tk.Frame):
         elif report and not content:
             self.notebook.select(1)
     
+    def update_content(self, content: str, progressive: bool = False):
+        """只更新结果内容，保留已有的分析报告
+        
+        Args:
+            content: 结果内容（纯净文本）
+            progressive: 长文本分段填充，先显示开头部分
+        """
+        self._content = content
+        self.content_output.set_content(content, progressive=progressive)
+        if hasattr(self, 'stats_label'):
+            self.stats_label.config(
+                text=f"结果: {len(content)} 字 | 报告: {len(self._report)} 字"
+            )
+    
     def set_result(self, result: dict):
         """设置结构化结果
         
@@ -1987,7 +2192,8 @@ class WorkflowConnector:
             'content_preview': content[:100] if content else ''
         })
         
-        # 根据目标页面填充内容
+        # 根据目标页面填充内容（目标页面可能尚未构建）
+        self.app._ensure_page(target_page)
         if target_page == "optimize":
             self._fill_optimize_page(content, as_context)
         elif target_page == "dedup":
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+EconPaper Pro - LLM 响应缓存
+对相同（或仅空白差异）的请求直接复用上一次的生成结果，省去网络往返和 Token 消耗
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# 连续空白归一化，用户重复输入时多余的空格/换行不影响命中
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class LLMCache:
+    """
+    进程内 LLM 响应缓存（精确匹配 + TTL + LRU 淘汰）
+
+    使用示例:
+        cache = LLMCache()
+        text = cache.complete(client, model="gpt-4o-mini", messages=[...])
+    """
+
+    def __init__(self, ttl: float = 3600, max_entries: int = 64):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()  # 键 -> (过期时间, 内容)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, Any]], **params) -> str:
+        """根据模型、消息和生成参数计算缓存键"""
+        normalized = [
+            {**m, "content": _WHITESPACE_RE.sub(" ", str(m.get("content", ""))).strip()}
+            for m in messages
+        ]
+        payload = json.dumps(
+            {"model": model, "messages": normalized, **params},
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """读取缓存，过期条目会被移除"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, content: str, ttl: Optional[float] = None):
+        """写入缓存（ttl 为空时使用默认有效期），超出容量时淘汰最久未使用的条目"""
+        if not content:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def complete(
+        self,
+        client,
+        model: str,
+        messages: List[Dict[str, Any]],
+        cache_ttl: Optional[float] = None,
+        **params
+    ) -> Optional[str]:
+        """
+        带缓存的 chat.completions 调用（非流式）
+
+        Args:
+            cache_ttl: 本次结果的缓存有效期（秒），为空时使用默认值
+
+        Returns:
+            Optional[str]: 生成的文本内容
+        """
+        key = self.make_key(model, messages, **params)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        response = client.chat.completions.create(model=model, messages=messages, **params)
+        content = response.choices[0].message.content
+        if content is not None:
+            self.put(key, content, ttl=cache_ttl)
+        return content
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
+
+# 全局缓存实例
+llm_cache = LLMCache()
@@ -26,26 +26,154 @@ import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext
 import threading
 import sys
+import time
 import os
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any, List, Tuple
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
 import queue
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import traceback
+import hashlib
+import logging
+import re
 
-# 尝试导入 OpenAI
-try:
-    from openai import OpenAI
-except ImportError:
-    OpenAI = None
+# OpenAI 延迟导入：首次需要时加载一次，之后直接复用
+_openai_cls = None
 
-# 尝试导入 python-docx 用于 Word 导出
-try:
-    import docx  # type: ignore[import-untyped]
-    HAS_DOCX = True
-except ImportError:
-    docx = None  # type: ignore[assignment]
-    HAS_DOCX = False
+
+def _openai():
+    """返回 OpenAI 类（首次调用时导入），未安装 openai 库时返回 None"""
+    global _openai_cls
+    if _openai_cls is None:
+        try:
+            from openai import OpenAI
+        except ImportError:
+            return None
+        _openai_cls = OpenAI
+    return _openai_cls
+
+# 嵌入模型名称匹配
+_EMBED_RE = re.compile(r'(?:embed|bge)', re.I)
+
+# 模型列表缓存有效期（秒）
+MODELS_CACHE_TTL = 60
+_models_list_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+
+
+@lru_cache(maxsize=8)
+def _get_openai_client(base_url: str, api_key: str):
+    """按 (API 地址, 密钥) 复用 OpenAI 客户端，避免重复建立连接"""
+    OpenAI = _openai()
+    if OpenAI is None:
+        raise ImportError("未安装 openai 库")
+    return OpenAI(base_url=base_url, api_key=api_key)
+
+
+def _llm_client():
+    """返回当前设置对应的 OpenAI 客户端（保存设置后自动切换到新的客户端）"""
+    return _get_openai_client(settings.llm_api_base, settings.llm_api_key)
+
+
+def _cached_models_list(base_url: str, api_key: str) -> List[str]:
+    """获取可用模型 ID 列表，TTL 内的重复请求直接返回缓存结果"""
+    key = (base_url, api_key)
+    cached = _models_list_cache.get(key)
+    if cached and time.monotonic() - cached[0] < MODELS_CACHE_TTL:
+        return cached[1]
+    
+    models = _get_openai_client(base_url, api_key).models.list()
+    model_ids = sorted(m.id for m in models.data)
+    _models_list_cache[key] = (time.monotonic(), model_ids)
+    return model_ids
+
+_TITLE_SPACE_RE = re.compile(r'\s+')
+# 历史记录时间戳（SQLite CURRENT_TIMESTAMP 格式），分组为 月-日 与 时:分
+_HISTORY_TS_RE = re.compile(r'\d{4}-(\d{2}-\d{2}) (\d{2}:\d{2}):\d{2}')
+# 术语列表分隔（兼容中英文逗号）
+_TERMS_RE = re.compile(r'[^,，]+')
+
+
+@lru_cache(maxsize=256)
+def _format_history_ts(timestamp: str) -> str:
+    """历史记录时间戳格式化为 "月-日 时:分"（记录写入后不再变化，重复刷新直接命中缓存）"""
+    m = _HISTORY_TS_RE.fullmatch(timestamp)
+    return f"{m[1]} {m[2]}" if m else (timestamp or 'N/A')
+
+
+def _normalize_title(title: Optional[str]) -> str:
+    """标题归一化（大小写折叠 + 空白合并），用于文献去重"""
+    return _TITLE_SPACE_RE.sub(' ', (title or '').casefold()).strip()
+
+def _atomic_write_text(path: Path, content: str):
+    """原子写入文本文件：先写入临时文件并落盘，再替换目标文件，避免中途失败损坏原文件"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    # 一次性编码后以二进制写入，绕过文本层的换行转换与分块编码
+    data = content.encode("utf-8")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+# 上次检索结果的恢复有效期（秒）
+LAST_SEARCH_TTL = 24 * 3600
+
+# AI 筛选结果缓存有效期（秒）：检索结果一天内基本不变
+AI_FILTER_CACHE_TTL = 24 * 3600
+
+# 引用格式模板（字段由 _generate_citations 预先提取）
+CITATION_TEMPLATES = {
+    "apa": "{authors} ({year}). {title}.{apa_journal}{apa_doi}",
+    "gb": "[{i}] {authors}. {title}[J]. {journal}, {year}.",
+    "mla": '{authors}. "{title}." {journal}, {year}.',
+    "chicago": '{authors}. "{title}." {journal} ({year}).{chicago_doi}',
+    "default": "{authors} ({year}). {title}. {journal}.",
+}
+
+# 文献检索结果缓存有效期（秒）与容量
+SEARCH_CACHE_TTL = 600
+SEARCH_CACHE_SIZE = 32
+_search_cache: "OrderedDict[tuple, Tuple[float, list]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _cached_search(search_func: Callable, query: str, **kwargs) -> list:
+    """调用文献检索函数，相同条件的检索在 TTL 内直接复用结果（LRU 淘汰）"""
+    key = (search_func.__module__, search_func.__name__, query, tuple(sorted(kwargs.items())))
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+            _search_cache.move_to_end(key)
+            return cached[1]
+    
+    results = search_func(query, **kwargs)
+    # 检索函数失败时返回空列表，空结果不缓存以便重试
+    if results:
+        with _search_cache_lock:
+            _search_cache[key] = (time.monotonic(), results)
+            _search_cache.move_to_end(key)
+            while len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+    return results
+
+# python-docx 延迟导入：仅在导出 Word 时加载
+_docx_module = None
+
+
+def _docx():
+    """返回 docx 模块（首次调用时导入），未安装 python-docx 时返回 None"""
+    global _docx_module
+    if _docx_module is None:
+        try:
+            import docx  # type: ignore[import-untyped]
+        except ImportError:
+            return None
+        _docx_module = docx
+    return _docx_module
 
 # 导入自定义组件
 from ui.components import (
@@ -53,9 +181,11 @@ from ui.components import (
     ModernButton, TaskManager, TextInputWithCount,
     TextOutputBox, NotificationBanner, KeyboardShortcuts,
     ConfirmDialog, DualOutputFrame, WorkflowConnector,
-    PreciseProgressBar, StreamingTextOutput
+    PreciseProgressBar, StreamingTextOutput, make_clickable
 )
+from ui.llm_cache import llm_cache
 from core.history import HistoryManager
+from config.settings import settings, reload_settings
 
 # 确保模块路径正确
 if getattr(sys, 'frozen', False):
@@ -68,6 +198,86 @@ else:
 sys.path.insert(0, str(BASE_DIR))
 sys.path.insert(0, str(INTERNAL_DIR))
 
+# 页面回收配置：可回收页面、闲置阈值与检查间隔
+EVICTABLE_PAGES = ("history", "settings")
+# 延迟构建的页面：首次显示（或首次接收流转内容）时才创建，启动时只构建默认的诊断页
+LAZY_PAGES = ("optimize", "dedup", "search", "revision", "history", "settings")
+
+# 已解析文件文本的缓存条数
+FILE_CACHE_SIZE = 4
+PAGE_EVICT_AFTER_SEC = 300
+PAGE_EVICT_INTERVAL_MS = 60_000
+# UI 更新队列轮询间隔（毫秒）
+QUEUE_POLL_ACTIVE_MS = 50
+QUEUE_POLL_IDLE_MS = 200
+# 单次处理 UI 更新队列的时间预算（秒），超出后让出给 Tk 重绘和响应输入
+QUEUE_DRAIN_BUDGET_SEC = 0.008
+# 侧边栏导航项共享的 bindtag 前缀，后接页面 ID
+NAV_TAG_PREFIX = "nav:"
+
+# 页面选项常量：页面重建时直接复用，不再每次构造列表
+OPT_STAGES = (
+    ("初稿重构", "draft"),
+    ("投稿优化", "submission"),
+    ("退修回应", "revision"),
+    ("终稿定稿", "final"),
+)
+JOURNAL_OPTIONS = ("", "经济研究", "管理世界", "金融研究", "中国工业经济", "会计研究", "其他")
+SECTION_DEFS = (
+    ("标题", "title"),
+    ("摘要", "abstract"),
+    ("引言", "introduction"),
+    ("文献综述", "literature"),
+    ("理论假设", "theory"),
+    ("研究方法", "methodology"),
+    ("实证结果", "results"),
+    ("结论", "conclusion"),
+)
+DEFAULT_SECTIONS = frozenset({"abstract", "introduction"})
+# 降重页术语输入框的占位提示
+DEDUP_TERMS_PLACEHOLDER = "用逗号分隔，如: DID, PSM"
+SEARCH_SOURCES = ("英文文献", "中文文献", "Semantic Scholar", "OpenAlex", "百度学术")
+# 模型下拉框的预置选项（拉取模型列表后会被替换）
+QUICK_MODEL_OPTIONS = ("gpt-4o-mini", "gpt-4o", "deepseek-chat", "Qwen/Qwen2.5-72B-Instruct")
+LLM_MODEL_OPTIONS = (
+    "gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "deepseek-chat", "deepseek-coder",
+    "Qwen/Qwen2.5-72B-Instruct", "claude-3-5-sonnet-20241022",
+)
+EMBED_MODEL_OPTIONS = (
+    "text-embedding-3-small", "text-embedding-3-large", "text-embedding-ada-002",
+    "BAAI/bge-m3", "BAAI/bge-large-zh-v1.5",
+)
+
+# 页面显示名称（状态栏）
+PAGE_NAMES = {
+    "diagnose": "论文诊断",
+    "optimize": "深度优化",
+    "dedup": "降重降AI",
+    "search": "学术搜索",
+    "revision": "退修助手",
+    "history": "历史记录",
+    "settings": "系统设置",
+}
+# 历史记录类型的显示名称
+HISTORY_TYPE_LABELS = {
+    "diagnose": "🔍 论文诊断",
+    "optimize": "⚙️ 深度优化",
+    "dedup": "📉 智能降重",
+    "deai": "🤖 降AI痕迹",
+    "deep_process": "⚡ 深度处理",
+    "search": "🔎 学术搜索",
+    "revision": "📝 退修助手",
+}
+# 历史记录类型 -> 恢复到的页面
+HISTORY_TARGET_PAGES = {
+    "diagnose": "diagnose",
+    "optimize": "optimize",
+    "dedup": "dedup",
+    "deai": "dedup",
+    "deep_process": "dedup",
+    "search": "search",
+    "revision": "revision",
+}
 
 
 class EconPaperApp:
@@ -79,20 +289,15 @@ class EconPaperApp:
         self.root.geometry("1400x900")
         self.root.minsize(1100, 700)
         
-        # 设置图标
-        try:
-            icon_path = BASE_DIR / "assets" / "icon.ico"
-            if icon_path.exists():
-                self.root.iconbitmap(str(icon_path))
-        except Exception:
-            pass
+        # 设置图标 - 推迟到空闲时执行，避免阻塞窗口首次绘制
+        self.root.after_idle(self._set_icon)
         
         # 配置样式
         self.style = ModernStyle.configure_styles(root)
         self.root.configure(bg=ModernStyle.BG_MAIN)
         
-        # 任务队列
-        self.update_queue = queue.Queue()
+        # 任务队列 - deque 的 append/popleft 在 GIL 下是原子操作，无需额外加锁
+        self.update_queue: deque = deque()
         
         # 任务管理器
         self.task_manager = TaskManager(self._safe_update)
@@ -103,6 +308,22 @@ class EconPaperApp:
         self.last_search_results = []  # 存储最近的搜索结果
         self.api_configured = False  # API是否已配置
         self.active_tasks = {}  # 活动任务跟踪
+        self._file_cache: OrderedDict = OrderedDict()  # (路径, 修改时间) -> 解析后的文本
+        self._file_cache_lock = threading.Lock()
+        self._file_parsing: Dict[tuple, threading.Event] = {}  # 正在解析的文件键 -> 完成事件
+        self._prefetch_tasks: Dict[str, str] = {}  # 页面 -> 文件预解析任务 ID
+        self._dedup_engine = None  # 降重/降AI引擎，首次使用时创建后复用
+        self._deai_engine = None
+        self._review_cancel: Optional[threading.Event] = None  # 文献综述流式生成的取消标记
+        self._expand_task: Optional[str] = None  # 进行中的关键词扩展任务 ID
+        self._silent_save_job: Optional[str] = None  # 待执行的 .env 静默保存
+        self._queue_job: Optional[str] = None  # 队列轮询与页面回收的定时器，关闭窗口时取消
+        self._evict_job: Optional[str] = None
+        self._env_mtime = self._env_file_mtime()  # 最近一次读取时 .env 的修改时间（导入时已读取）
+        self._env_digest: Optional[Tuple[float, bytes]] = None  # (.env 修改时间, 内容摘要)
+        self._first_run_win: Optional[tk.Toplevel] = None  # 复用的对话框窗口
+        self._about_win: Optional[tk.Toplevel] = None
+        self._pending_storage_update = False
         
         # 历史记录管理器 - 必须在 _create_layout() 之前初始化
         # 因为 _create_template_selector() 需要使用 self.history
@@ -131,15 +352,42 @@ class EconPaperApp:
         # 启动UI更新循环
         self._process_queue()
         
-        # 加载持久化偏好 (P2)
-        self.root.after(100, self._load_ui_preferences)
-
-        # 首次使用检查
-        self.root.after(500, self._check_first_run)
+        # 窗口首次绘制后统一执行启动后的初始化
+        self.root.after_idle(self._post_init)
+        
+        # 后台预热 Agent 模块，避免首次点击时的冷导入卡顿
+        threading.Thread(target=self._warmup_agents, daemon=True, name="agents-warmup").start()
         
         # 窗口关闭处理
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
     
+    def _post_init(self):
+        """启动后初始化：加载偏好、同步模型选择器，并稍后进行首次使用检查"""
+        self._load_ui_preferences()
+        self._sync_quick_model_selector()
+        # 首次使用引导为弹窗，稍作延迟让主窗口先完成显示
+        self.root.after(400, self._check_first_run)
+    
+    @staticmethod
+    def _warmup_agents():
+        """预先导入 Agent 模块（失败时静默，留给实际调用时报告错误）"""
+        try:
+            import agents.master  # noqa: F401
+            import agents.diagnostic  # noqa: F401
+            import agents.optimizer  # noqa: F401
+            import agents.revision  # noqa: F401
+        except Exception:
+            pass
+    
+    def _set_icon(self):
+        """设置窗口图标"""
+        try:
+            icon_path = BASE_DIR / "assets" / "icon.ico"
+            if icon_path.exists():
+                self.root.iconbitmap(str(icon_path))
+        except Exception:
+            pass
+    
     def _create_status_bar(self):
         """创建状态栏"""
         self.status_bar = StatusBar(self.root)
@@ -179,23 +427,48 @@ class EconPaperApp:
         if self.is_processing:
             if not ConfirmDialog.show(self.root, "确认退出", "有任务正在进行中，确定要退出吗？"):
                 return
+        if self._review_cancel is not None:
+            self._review_cancel.set()
+        self._flush_silent_save()
+        # 取消周期性定时器，避免窗口销毁后仍有回调被触发
+        for job in (self._queue_job, self._evict_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self.task_manager.shutdown()
         self.root.destroy()
         
     def _process_queue(self):
         """处理队列中的UI更新任务"""
+        drained = 0
+        deadline = time.perf_counter() + QUEUE_DRAIN_BUDGET_SEC
         try:
             while True:
-                task = self.update_queue.get_nowait()
+                try:
+                    task = self.update_queue.popleft()
+                except IndexError:
+                    break
+                drained += 1
                 if callable(task):
-                    task()
-        except queue.Empty:
-            pass
+                    try:
+                        task()
+                    except Exception:
+                        # 单个回调出错（如控件已销毁）不影响队列中其余更新
+                        traceback.print_exc()
+                if time.perf_counter() > deadline:
+                    # 突发大量回调时分批处理，剩余部分在下一个空闲时段继续
+                    break
         finally:
-            self.root.after(50, self._process_queue)
+            if drained:
+                # 刚处理过更新（或预算用尽仍有剩余）：当前事件处理完即再次检查
+                self._queue_job = self.root.after_idle(self._process_queue)
+            else:
+                # 有后台任务时高频轮询，空闲时降低唤醒频率
+                interval = QUEUE_POLL_ACTIVE_MS if self.task_manager.has_active() else QUEUE_POLL_IDLE_MS
+                self._queue_job = self.root.after(interval, self._process_queue)
     
     def _safe_update(self, func):
-        """线程安全的UI更新"""
-        self.update_queue.put(func)
+        """线程安全的UI更新：只追加到 deque，由主线程的 _process_queue 取出执行"""
+        self.update_queue.append(func)
         
     def _create_layout(self):
         """创建主布局"""
@@ -208,22 +481,34 @@ class EconPaperApp:
         self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         self.pages = {}
+        self._visible_page: Optional[str] = None  # 当前已 pack 的页面
         self.progress_indicators = {}
         self.precise_progress = {} # P0 新增：精确进度条
         
+        # 页面构建函数，被回收的页面在再次显示时按需重建
+        self._page_builders = {
+            "diagnose": self._create_diagnose_page,
+            "optimize": self._create_optimize_page,
+            "dedup": self._create_dedup_page,
+            "search": self._create_search_page,
+            "revision": self._create_revision_page,
+            "history": self._create_history_page,
+            "settings": self._create_settings_page,
+        }
+        self._last_shown = {}  # page_id -> 最近一次显示的时间
+        
         # 创建顶部工具栏 (P3)
         self._create_top_bar()
         
-        self._create_diagnose_page()
-        self._create_optimize_page()
-        self._create_dedup_page()
-        self._create_search_page()
-        self._create_revision_page()
-        self._create_history_page()
-        self._create_settings_page()
+        for page_id, builder in self._page_builders.items():
+            if page_id not in LAZY_PAGES:
+                builder()
         
         self._show_page("diagnose")
         
+        # 定期回收长时间未显示的页面
+        self._evict_job = self.root.after(PAGE_EVICT_INTERVAL_MS, self._evict_pages)
+        
     def _create_sidebar(self, parent):
         """创建侧边栏 - 优化字体大小"""
         sidebar = tk.Frame(parent, bg=ModernStyle.BG_SIDEBAR, width=260)
@@ -269,7 +554,7 @@ class EconPaperApp:
         tk.Label(
             logo_frame,
             text="经管学术论文智能助手",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SIDEBAR,
             fg=ModernStyle.TEXT_MUTED
         ).pack(anchor="w", pady=(8, 0))
@@ -282,6 +567,7 @@ class EconPaperApp:
         nav_frame.pack(fill=tk.X, padx=12)
         
         self.nav_buttons = {}
+        self._nav_state = {}  # page_id -> "selected" | "hover" | "normal"，用于跳过无需更新的导航项
         nav_items = [
             ("diagnose", "🔍", "论文诊断", "多维度分析评估"),
             ("optimize", "⚙️", "深度优化", "智能优化改写"),
@@ -291,42 +577,50 @@ class EconPaperApp:
             ("history", "🕒", "历史记录", "查看及恢复历史结果"),
         ]
         
+        # 循环内反复使用的样式值先绑定为局部变量
+        bg = ModernStyle.BG_SIDEBAR
+        fg_title = ModernStyle.TEXT_PRIMARY
+        fg_desc = ModernStyle.TEXT_MUTED
+        icon_font = ModernStyle.FONT_ICON
+        title_font = ModernStyle.FONT_MD
+        desc_font = ModernStyle.FONT_XS
+        
         for page_id, icon, title, desc in nav_items:
-            btn_frame = tk.Frame(nav_frame, bg=ModernStyle.BG_SIDEBAR, cursor="hand2")
+            btn_frame = make_clickable(tk.Frame(nav_frame, bg=bg))
             btn_frame.pack(fill=tk.X, pady=3)
             
-            btn_inner = tk.Frame(btn_frame, bg=ModernStyle.BG_SIDEBAR, padx=15, pady=12)
+            btn_inner = tk.Frame(btn_frame, bg=bg, padx=15, pady=12)
             btn_inner.pack(fill=tk.X)
             
             # 添加左侧指示条
-            indicator = tk.Frame(btn_frame, bg=ModernStyle.BG_SIDEBAR, width=4)
+            indicator = tk.Frame(btn_frame, bg=bg, width=4)
             indicator.place(relx=0, rely=0, relheight=1)
             
             tk.Label(
                 btn_inner,
                 text=icon,
-                font=(ModernStyle.FONT_FAMILY, 16),
-                bg=ModernStyle.BG_SIDEBAR
+                font=icon_font,
+                bg=bg
             ).pack(side=tk.LEFT)
             
-            text_frame = tk.Frame(btn_inner, bg=ModernStyle.BG_SIDEBAR)
+            text_frame = tk.Frame(btn_inner, bg=bg)
             text_frame.pack(side=tk.LEFT, padx=12)
             
             title_label = tk.Label(
                 text_frame,
                 text=title,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                bg=ModernStyle.BG_SIDEBAR,
-                fg=ModernStyle.TEXT_PRIMARY
+                font=title_font,
+                bg=bg,
+                fg=fg_title
             )
             title_label.pack(anchor="w")
             
             desc_label = tk.Label(
                 text_frame,
                 text=desc,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
-                bg=ModernStyle.BG_SIDEBAR,
-                fg=ModernStyle.TEXT_MUTED
+                font=desc_font,
+                bg=bg,
+                fg=fg_desc
             )
             desc_label.pack(anchor="w")
             
@@ -338,10 +632,10 @@ class EconPaperApp:
                 "desc": desc_label
             }
             
-            for widget in [btn_frame, btn_inner, title_label, desc_label]:
-                widget.bind("<Button-1>", lambda e, p=page_id: self._show_page(p))
-                widget.bind("<Enter>", lambda e, p=page_id: self._on_nav_hover(p, True))
-                widget.bind("<Leave>", lambda e, p=page_id: self._on_nav_hover(p, False))
+            tag = self._tag_nav_widgets(page_id, btn_frame, btn_inner, title_label, desc_label)
+            self.root.bind_class(tag, "<Button-1>", self._on_nav_click)
+            self.root.bind_class(tag, "<Enter>", self._on_nav_enter)
+            self.root.bind_class(tag, "<Leave>", self._on_nav_leave)
         
         # 底部按钮区
         bottom_frame = tk.Frame(sidebar, bg=ModernStyle.BG_SIDEBAR)
@@ -351,7 +645,7 @@ class EconPaperApp:
         sep2.pack(fill=tk.X, pady=(0, 15))
         
         # 设置按钮
-        settings_btn = tk.Frame(bottom_frame, bg=ModernStyle.BG_SIDEBAR, cursor="hand2")
+        settings_btn = make_clickable(tk.Frame(bottom_frame, bg=ModernStyle.BG_SIDEBAR))
         settings_btn.pack(fill=tk.X, pady=3)
         
         settings_inner = tk.Frame(settings_btn, bg=ModernStyle.BG_SIDEBAR, padx=15, pady=12)
@@ -364,19 +658,17 @@ class EconPaperApp:
         settings_icon = tk.Label(
             settings_inner,
             text="⚙️",
-            font=(ModernStyle.FONT_FAMILY, 16),
-            bg=ModernStyle.BG_SIDEBAR,
-            cursor="hand2"
+            font=ModernStyle.FONT_ICON,
+            bg=ModernStyle.BG_SIDEBAR
         )
         settings_icon.pack(side=tk.LEFT)
         
         settings_text = tk.Label(
             settings_inner,
             text="系统设置",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SIDEBAR,
-            fg=ModernStyle.TEXT_PRIMARY,
-            cursor="hand2"
+            fg=ModernStyle.TEXT_PRIMARY
         )
         settings_text.pack(side=tk.LEFT, padx=12)
         
@@ -388,16 +680,11 @@ class EconPaperApp:
             "desc": None
         }
         
-        def on_settings_click(e):
-            self._show_page("settings")
-        
-        settings_btn.bind("<Button-1>", on_settings_click)
-        settings_inner.bind("<Button-1>", on_settings_click)
-        settings_icon.bind("<Button-1>", on_settings_click)
-        settings_text.bind("<Button-1>", on_settings_click)
+        tag = self._tag_nav_widgets("settings", settings_btn, settings_inner, settings_icon, settings_text)
+        self.root.bind_class(tag, "<Button-1>", self._on_nav_click)
         
         # 关于按钮
-        about_btn = tk.Frame(bottom_frame, bg=ModernStyle.BG_SIDEBAR, cursor="hand2")
+        about_btn = make_clickable(tk.Frame(bottom_frame, bg=ModernStyle.BG_SIDEBAR))
         about_btn.pack(fill=tk.X, pady=3)
         
         about_inner = tk.Frame(about_btn, bg=ModernStyle.BG_SIDEBAR, padx=15, pady=10)
@@ -407,28 +694,51 @@ class EconPaperApp:
             about_inner,
             text="ℹ️",
             font=(ModernStyle.FONT_FAMILY, 14),
-            bg=ModernStyle.BG_SIDEBAR,
-            cursor="hand2"
+            bg=ModernStyle.BG_SIDEBAR
         )
         about_icon.pack(side=tk.LEFT)
         
         about_text = tk.Label(
             about_inner,
             text=f"关于 v{VERSION}",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_SIDEBAR,
-            fg=ModernStyle.TEXT_MUTED,
-            cursor="hand2"
+            fg=ModernStyle.TEXT_MUTED
         )
         about_text.pack(side=tk.LEFT, padx=12)
         
-        def on_about_click(e):
-            self._show_about_dialog()
-        
-        about_btn.bind("<Button-1>", on_about_click)
-        about_inner.bind("<Button-1>", on_about_click)
-        about_icon.bind("<Button-1>", on_about_click)
-        about_text.bind("<Button-1>", on_about_click)
+        tag = self._tag_nav_widgets("about", about_btn, about_inner, about_icon, about_text)
+        self.root.bind_class(tag, "<Button-1>", lambda e: self._show_about_dialog())
+
+    @staticmethod
+    def _tag_nav_widgets(page_id: str, *widgets) -> str:
+        """为导航项的各个控件追加共享的 bindtag，事件只需在该 tag 上绑定一次"""
+        tag = NAV_TAG_PREFIX + page_id
+        for widget in widgets:
+            widget.bindtags(widget.bindtags() + (tag,))
+            # 页面 ID 同时记在控件对象上，事件处理时无需再查询 bindtags
+            widget.nav_page_id = page_id
+        return tag
+    
+    @staticmethod
+    def _nav_page_of(widget) -> Optional[str]:
+        """返回导航项控件对应的页面 ID"""
+        return getattr(widget, "nav_page_id", None)
+    
+    def _on_nav_click(self, event):
+        page_id = self._nav_page_of(event.widget)
+        if page_id:
+            self._show_page(page_id)
+    
+    def _on_nav_enter(self, event):
+        page_id = self._nav_page_of(event.widget)
+        if page_id:
+            self._on_nav_hover(page_id, True)
+    
+    def _on_nav_leave(self, event):
+        page_id = self._nav_page_of(event.widget)
+        if page_id:
+            self._on_nav_hover(page_id, False)
 
     def _on_nav_hover(self, page_id, is_enter):
         """导航悬停效果"""
@@ -438,6 +748,12 @@ class EconPaperApp:
         btn = self.nav_buttons[page_id]
         if self.current_tab.get() == page_id:
             return
+        
+        # 同一导航项的多个子控件会连续触发悬停事件，状态未变化时跳过
+        desired = "hover" if is_enter else "normal"
+        if self._nav_state.get(page_id) == desired:
+            return
+        self._nav_state[page_id] = desired
             
         bg_color = ModernStyle.BG_HOVER if is_enter else ModernStyle.BG_SIDEBAR
         btn["frame"].config(bg=bg_color)
@@ -446,53 +762,122 @@ class EconPaperApp:
         if btn["desc"]:
             btn["desc"].config(bg=bg_color)
 
-    def _update_nav_style(self):
-        """更新导航栏选中样式"""
+    def _update_nav_style(self) -> bool:
+        """更新导航栏选中样式（仅更新状态发生变化的导航项），返回是否有导航项发生变化"""
         current = self.current_tab.get()
+        changed = False
+        selected_bg = ModernStyle.PRIMARY_LIGHT
+        normal_bg = ModernStyle.BG_SIDEBAR
+        primary = ModernStyle.PRIMARY
+        selected_font = ModernStyle.FONT_MD_BOLD
+        normal_font = ModernStyle.FONT_MD
         for page_id, btn in self.nav_buttons.items():
-            if page_id == current:
-                bg_color = ModernStyle.PRIMARY_LIGHT
+            desired = "selected" if page_id == current else "normal"
+            if self._nav_state.get(page_id) == desired:
+                continue
+            self._nav_state[page_id] = desired
+            changed = True
+            
+            if desired == "selected":
+                bg_color = selected_bg
                 btn["frame"].config(bg=bg_color)
                 btn["inner"].config(bg=bg_color)
-                btn["indicator"].config(bg=ModernStyle.PRIMARY)
-                btn["title"].config(bg=bg_color, fg=ModernStyle.PRIMARY, font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"))
+                btn["indicator"].config(bg=primary)
+                btn["title"].config(bg=bg_color, fg=primary, font=selected_font)
                 if btn["desc"]:
-                    btn["desc"].config(bg=bg_color, fg=ModernStyle.PRIMARY)
+                    btn["desc"].config(bg=bg_color, fg=primary)
             else:
-                bg_color = ModernStyle.BG_SIDEBAR
+                bg_color = normal_bg
                 btn["frame"].config(bg=bg_color)
                 btn["inner"].config(bg=bg_color)
                 btn["indicator"].config(bg=bg_color)
-                btn["title"].config(bg=bg_color, fg=ModernStyle.TEXT_PRIMARY, font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD))
+                btn["title"].config(bg=bg_color, fg=ModernStyle.TEXT_PRIMARY, font=normal_font)
                 if btn["desc"]:
                     btn["desc"].config(bg=bg_color, fg=ModernStyle.TEXT_MUTED)
+        
+        return changed
     
     def _show_page(self, page_id: str):
         """显示指定页面"""
         self.current_tab.set(page_id)
-        self._update_nav_style()
+        nav_changed = self._update_nav_style()
         
         # 持久化当前页面偏好 (P2)
         self._save_ui_preference("last_page", page_id)
         
-        for page in self.pages.values():
-            page.pack_forget()
+        # 只有当前显示的页面处于 pack 状态，切换时只需隐藏它一个
+        previous = self._visible_page
+        if previous != page_id and previous in self.pages:
+            self.pages[previous].pack_forget()
+            # 回收计时从页面被隐藏时开始，而不是从它最初显示时
+            self._last_shown[previous] = time.monotonic()
+        
+        # 延迟构建或已被回收的页面在此创建
+        built = page_id not in self.pages
+        if built:
+            # 构建耗时较长，先刷新一次让导航高亮立即可见；
+            # 已构建的页面则不强制刷新，导航样式与页面切换在同一次空闲重绘中完成
+            if nav_changed:
+                self.root.update_idletasks()
+            self._ensure_page(page_id)
+            if page_id == "search" and "search" in self.pages:
+                # 由导航打开时才恢复上次会话的检索结果；
+                # 跨页面填充经 _ensure_page 先行构建，不会被恢复的旧结果覆盖
+                try:
+                    self._restore_last_search()
+                except Exception:
+                    pass
         
         if page_id in self.pages:
-            self.pages[page_id].pack(fill=tk.BOTH, expand=True)
+            if previous != page_id:
+                self.pages[page_id].pack(fill=tk.BOTH, expand=True)
+            self._visible_page = page_id
+            self._last_shown[page_id] = time.monotonic()
             
         # 更新状态栏 - 安全检查，因为初始化时 status_bar 可能还未创建
         if hasattr(self, 'status_bar'):
-            page_names = {
-                "diagnose": "论文诊断",
-                "optimize": "深度优化",
-                "dedup": "降重降AI",
-                "search": "学术搜索",
-                "revision": "退修助手",
-                "history": "历史记录",
-                "settings": "系统设置"
-            }
-            self.status_bar.set_status(f"当前页面: {page_names.get(page_id, page_id)}", "info")
+            self.status_bar.set_status(f"当前页面: {PAGE_NAMES.get(page_id, page_id)}", "info")
+    
+    def _ensure_page(self, page_id: str):
+        """确保页面已构建（不切换显示），供跨页面填充内容前调用"""
+        if page_id not in self.pages and page_id in self._page_builders:
+            self._page_builders[page_id]()
+    
+    def _evict_pages(self):
+        """回收长时间未显示的可重建页面，释放其控件占用的内存
+        
+        仅回收状态可从持久化数据完整恢复的页面（历史记录、设置），
+        工作页面保留用户输入与结果，不参与回收。
+        """
+        try:
+            now = time.monotonic()
+            current = self.current_tab.get()
+            for page_id in EVICTABLE_PAGES:
+                if page_id == current or page_id not in self.pages:
+                    continue
+                if now - self._last_shown.get(page_id, 0) < PAGE_EVICT_AFTER_SEC:
+                    continue
+                if page_id == "settings" and self._settings_form_dirty():
+                    # 表单中有未保存的修改，回收会丢失这些输入
+                    continue
+                self.pages.pop(page_id).destroy()
+                self._last_shown.pop(page_id, None)
+        finally:
+            self._evict_job = self.root.after(PAGE_EVICT_INTERVAL_MS, self._evict_pages)
+    
+    def _settings_form_dirty(self) -> bool:
+        """设置页表单内容是否与当前已加载的配置不同"""
+        try:
+            for widget_attr, setting_attr, default in self._SETTING_FIELDS:
+                if getattr(self, widget_attr).get() != (getattr(settings, setting_attr) or default):
+                    return True
+            return (
+                self.setting_data_dir.get().strip() != settings.data_dir
+                or self.setting_workspace_dir.get().strip() != settings.workspace_dir
+            )
+        except (AttributeError, tk.TclError):
+            # 控件不完整时保守处理，不回收
+            return True
     
     def _create_top_bar(self):
         """创建全局顶部工具栏 - 支持快速切换模型 (P3)"""
@@ -505,7 +890,7 @@ class EconPaperApp:
         tk.Label(
             self.top_bar,
             textvariable=self.top_title_var,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_LG, "bold"),
+            font=ModernStyle.FONT_LG_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT)
@@ -517,7 +902,7 @@ class EconPaperApp:
         tk.Label(
             model_frame,
             text="🤖 当前模型:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED
         ).pack(side=tk.LEFT, padx=10)
@@ -526,21 +911,18 @@ class EconPaperApp:
         self.quick_model_combo = ttk.Combobox(
             model_frame,
             textvariable=self.quick_model_var,
-            values=["gpt-4o-mini", "gpt-4o", "deepseek-chat", "Qwen/Qwen2.5-72B-Instruct"],
+            values=QUICK_MODEL_OPTIONS,
             state="readonly",
             width=25,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS)
+            font=ModernStyle.FONT_XS
         )
         self.quick_model_combo.pack(side=tk.LEFT)
         self.quick_model_combo.bind("<<ComboboxSelected>>", self._on_quick_model_change)
-        
-        # 初始加载模型名称
-        self.root.after(1000, self._sync_quick_model_selector)
+
 
     def _sync_quick_model_selector(self):
         """同步快速选择器的模型名称"""
         try:
-            from config.settings import settings
             if settings.llm_model:
                 self.quick_model_var.set(settings.llm_model)
         except Exception:
@@ -550,35 +932,57 @@ class EconPaperApp:
         """快速切换模型回调"""
         new_model = self.quick_model_var.get()
         try:
-            from config.settings import settings
             settings.llm_model = new_model
             # 同时更新设置页面的显示
-            if hasattr(self, 'setting_llm_model'):
+            if "settings" in self.pages:
                 self.setting_llm_model.set(new_model)
             
             self.notification.show(f"模型已快速切换至: {new_model}", "success")
-            # 保存到 .env 以便持久化
-            self._save_settings_silent()
+            # 保存到 .env 以便持久化（连续切换时合并为一次写入）
+            self._schedule_silent_save()
         except Exception as e:
             self.notification.show(f"切换失败: {e}", "error")
 
+    def _schedule_silent_save(self, delay_ms: int = 500):
+        """延迟静默保存，delay_ms 内的多次修改只写一次文件"""
+        if self._silent_save_job is not None:
+            self.root.after_cancel(self._silent_save_job)
+        self._silent_save_job = self.root.after(delay_ms, self._flush_silent_save)
+    
+    def _flush_silent_save(self):
+        """立即执行待处理的静默保存"""
+        if self._silent_save_job is not None:
+            self.root.after_cancel(self._silent_save_job)
+            self._silent_save_job = None
+            self._save_settings_silent()
+
     def _save_settings_silent(self):
         """静默保存设置到 .env"""
         try:
-            from config.settings import settings
             env_path = BASE_DIR / ".env"
+            # 写入前文件是否已被外部修改（修改时间与上次读取时不同）
+            external_change = self._env_file_mtime() != self._env_mtime
             # 读取现有内容
+            old = env_path.read_text(encoding="utf-8") if env_path.exists() else ""
             lines = []
-            if env_path.exists():
-                with open(env_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if "LLM_MODEL=" in line:
-                            lines.append(f"LLM_MODEL={settings.llm_model}\n")
-                        else:
-                            lines.append(line)
+            for line in old.splitlines(keepends=True):
+                if "LLM_MODEL=" in line:
+                    lines.append(f"LLM_MODEL={settings.llm_model}\n")
+                else:
+                    lines.append(line)
             
-            with open(env_path, "w", encoding="utf-8") as f:
-                f.writelines(lines)
+            new = "".join(lines)
+            # 重新选择了相同模型时内容不变，无需重写文件
+            if new != old:
+                _atomic_write_text(env_path, new)
+                if external_change:
+                    # 外部修改尚未读取，连同本次写入一起重新加载
+                    self._reload_env_settings()
+                else:
+                    # 记录本次写入，避免下次检查时把自己的写入当作外部修改重新解析
+                    mtime = self._env_file_mtime()
+                    self._env_mtime = mtime
+                    self._env_digest = (mtime, hashlib.blake2b(new.encode("utf-8"), digest_size=16).digest())
         except Exception:
             pass
 
@@ -590,7 +994,7 @@ class EconPaperApp:
         tk.Label(
             header,
             text=title,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XXL, "bold"),
+            font=ModernStyle.FONT_XXL_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(anchor="w")
@@ -598,7 +1002,7 @@ class EconPaperApp:
         tk.Label(
             header,
             text=subtitle,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_SECONDARY
         ).pack(anchor="w", pady=(5, 0))
@@ -619,7 +1023,7 @@ class EconPaperApp:
         content = tk.Frame(page, bg=ModernStyle.BG_MAIN)
         content.pack(fill=tk.BOTH, expand=True, padx=ModernStyle.PADDING_XL, pady=(0, ModernStyle.PADDING_XL))
         
-        paned = tk.PanedWindow(content, orient=tk.HORIZONTAL, bg=ModernStyle.BG_MAIN, sashwidth=8, sashrelief=tk.FLAT)
+        paned = tk.PanedWindow(content, orient=tk.HORIZONTAL, bg=ModernStyle.BG_MAIN, sashwidth=8, sashrelief=tk.FLAT, opaqueresize=False)
         paned.pack(fill=tk.BOTH, expand=True)
         
         # 左侧输入
@@ -644,7 +1048,7 @@ class EconPaperApp:
         self.diag_file_label = tk.Label(
             toolbar,
             text="支持 PDF/Word 文档",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED,
             padx=15
@@ -654,7 +1058,7 @@ class EconPaperApp:
         tk.Label(
             left_panel,
             text="论文内容",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(anchor="w", pady=(0, 10))
@@ -713,7 +1117,7 @@ class EconPaperApp:
         tk.Label(
             result_header,
             text="诊断结果",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT)
@@ -738,6 +1142,7 @@ class EconPaperApp:
         
         self.diag_file_path = None
         self.diag_file_paths = []
+        self.diag_file_infos = []  # [(路径, 文件类型)]，选择文件时一次性解析
         
     def _create_optimize_page(self):
         """创建深度优化页面"""
@@ -764,20 +1169,13 @@ class EconPaperApp:
         tk.Label(
             config_inner,
             text="优化阶段",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(anchor="w", pady=(0, 12))
         
         self.opt_stage = tk.StringVar(value="submission")
-        stages = [
-            ("初稿重构", "draft"),
-            ("投稿优化", "submission"),
-            ("退修回应", "revision"),
-            ("终稿定稿", "final")
-        ]
-        
-        for text, value in stages:
+        for text, value in OPT_STAGES:
             rb = tk.Radiobutton(
                 config_inner,
                 text=text,
@@ -787,7 +1185,7 @@ class EconPaperApp:
                 fg=ModernStyle.TEXT_PRIMARY,
                 activebackground=ModernStyle.BG_SECONDARY,
                 selectcolor=ModernStyle.BG_SECONDARY,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+                font=ModernStyle.FONT_SM
             )
             rb.pack(anchor="w", pady=3)
         
@@ -795,20 +1193,19 @@ class EconPaperApp:
         tk.Label(
             config_inner,
             text="目标期刊",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(anchor="w", pady=(22, 12))
         
         self.opt_journal = tk.StringVar(value="")
-        journals = ["", "经济研究", "管理世界", "金融研究", "中国工业经济", "会计研究", "其他"]
         journal_combo = ttk.Combobox(
             config_inner,
             textvariable=self.opt_journal,
-            values=journals,
+            values=JOURNAL_OPTIONS,
             state="readonly",
             width=24,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         )
         journal_combo.pack(fill=tk.X)
         
@@ -816,25 +1213,14 @@ class EconPaperApp:
         tk.Label(
             config_inner,
             text="优化章节",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(anchor="w", pady=(22, 12))
         
-        sections = [
-            ("标题", "title"),
-            ("摘要", "abstract"),
-            ("引言", "introduction"),
-            ("文献综述", "literature"),
-            ("理论假设", "theory"),
-            ("研究方法", "methodology"),
-            ("实证结果", "results"),
-            ("结论", "conclusion")
-        ]
-        
         self.opt_sections = {}
-        for text, value in sections:
-            var = tk.BooleanVar(value=value in ["abstract", "introduction"])
+        for text, value in SECTION_DEFS:
+            var = tk.BooleanVar(value=value in DEFAULT_SECTIONS)
             self.opt_sections[value] = var
             cb = tk.Checkbutton(
                 config_inner,
@@ -844,7 +1230,7 @@ class EconPaperApp:
                 fg=ModernStyle.TEXT_PRIMARY,
                 activebackground=ModernStyle.BG_SECONDARY,
                 selectcolor=ModernStyle.BG_SECONDARY,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+                font=ModernStyle.FONT_SM
             )
             cb.pack(anchor="w", pady=2)
         
@@ -852,7 +1238,7 @@ class EconPaperApp:
         tk.Label(
             config_inner,
             text="上传文件",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(anchor="w", pady=(22, 12))
@@ -872,7 +1258,7 @@ class EconPaperApp:
         self.opt_file_label = tk.Label(
             config_inner,
             text="未选择文件",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED,
             wraplength=220
@@ -900,19 +1286,18 @@ class EconPaperApp:
         tk.Label(
             context_header,
             text="📎 参考背景 / 审稿意见 (可选)",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM, "bold"),
+            font=ModernStyle.FONT_SM_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_SECONDARY
         ).pack(side=tk.LEFT)
         
-        self.context_toggle_btn = tk.Label(
+        self.context_toggle_btn = make_clickable(tk.Label(
             context_header,
             text="[ 展开 + ]",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
-            fg=ModernStyle.PRIMARY,
-            cursor="hand2"
-        )
+            fg=ModernStyle.PRIMARY
+        ))
         self.context_toggle_btn.pack(side=tk.LEFT, padx=10)
         self.context_toggle_btn.bind("<Button-1>", lambda e: self._toggle_opt_context())
         
@@ -925,7 +1310,7 @@ class EconPaperApp:
         tk.Label(
             right_panel,
             text="论文内容",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(anchor="w", pady=(5, 8))
         
@@ -951,7 +1336,7 @@ class EconPaperApp:
         tk.Label(
             right_panel,
             text="优化结果",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(anchor="w", pady=(0, 8))
         
@@ -973,6 +1358,7 @@ class EconPaperApp:
         
         self.opt_file_path = None
         self.opt_file_paths = []
+        self.opt_file_infos = []  # [(路径, 文件类型)]
 
     def _toggle_opt_context(self, show: Optional[bool] = None):
         """切换优化页面的背景参考区域显示状态"""
@@ -1015,7 +1401,7 @@ class EconPaperApp:
         tk.Label(
             params_frame,
             text="处理强度:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT)
@@ -1030,7 +1416,7 @@ class EconPaperApp:
             highlightthickness=0,
             troughcolor=ModernStyle.BORDER,
             activebackground=ModernStyle.PRIMARY,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         )
         self.dedup_strength.set(3)
         self.dedup_strength.pack(side=tk.LEFT, padx=12)
@@ -1038,7 +1424,7 @@ class EconPaperApp:
         tk.Label(
             params_frame,
             text="1轻度 ←→ 5深度",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED
         ).pack(side=tk.LEFT, padx=8)
@@ -1046,21 +1432,21 @@ class EconPaperApp:
         tk.Label(
             params_frame,
             text="保留术语:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT, padx=(35, 0))
         
         self.dedup_terms = tk.Entry(
             params_frame,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             width=32,
             bg=ModernStyle.BG_MAIN,
             relief="flat"
         )
         self.dedup_terms.pack(side=tk.LEFT, padx=12, ipady=6)
-        self.dedup_terms.insert(0, "用逗号分隔，如: DID, PSM")
-        self.dedup_terms.bind("<FocusIn>", lambda e: self.dedup_terms.delete(0, tk.END) if "逗号分隔" in self.dedup_terms.get() else None)
+        self.dedup_terms.insert(0, DEDUP_TERMS_PLACEHOLDER)
+        self.dedup_terms.bind("<FocusIn>", self._clear_terms_placeholder)
         
         # 文件上传 (P3)
         ModernButton(
@@ -1078,7 +1464,7 @@ class EconPaperApp:
         self.dedup_file_label = tk.Label(
             params_frame,
             text="",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.SUCCESS
         )
@@ -1088,7 +1474,7 @@ class EconPaperApp:
         text_frame = tk.Frame(content, bg=ModernStyle.BG_MAIN)
         text_frame.pack(fill=tk.BOTH, expand=True)
         
-        paned = tk.PanedWindow(text_frame, orient=tk.HORIZONTAL, bg=ModernStyle.BG_MAIN, sashwidth=8)
+        paned = tk.PanedWindow(text_frame, orient=tk.HORIZONTAL, bg=ModernStyle.BG_MAIN, sashwidth=8, opaqueresize=False)
         paned.pack(fill=tk.BOTH, expand=True)
         
         # 左侧输入
@@ -1097,7 +1483,7 @@ class EconPaperApp:
         tk.Label(
             left_panel,
             text="原始文本",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(anchor="w", pady=(0, 8))
         
@@ -1142,7 +1528,7 @@ class EconPaperApp:
         tk.Label(
             dedup_result_header,
             text="改写结果",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(side=tk.LEFT)
         
@@ -1190,7 +1576,7 @@ class EconPaperApp:
         
         self.search_query = tk.Entry(
             search_frame,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_LG),
+            font=ModernStyle.FONT_LG,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             relief="flat",
@@ -1218,10 +1604,10 @@ class EconPaperApp:
         source_combo = ttk.Combobox(
             search_frame,
             textvariable=self.search_source,
-            values=["英文文献", "中文文献", "Semantic Scholar", "OpenAlex", "百度学术"],
+            values=SEARCH_SOURCES,
             state="readonly",
             width=14,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         )
         source_combo.pack(side=tk.LEFT, padx=12)
         
@@ -1240,7 +1626,7 @@ class EconPaperApp:
         tk.Label(
             filter_frame,
             text="结果数量:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT, padx=(0, 8))
@@ -1255,7 +1641,7 @@ class EconPaperApp:
             highlightthickness=0,
             troughcolor=ModernStyle.BORDER,
             activebackground=ModernStyle.PRIMARY,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS)
+            font=ModernStyle.FONT_XS
         )
         self.search_limit.set(15)
         self.search_limit.pack(side=tk.LEFT, padx=8)
@@ -1264,14 +1650,14 @@ class EconPaperApp:
         tk.Label(
             filter_frame,
             text="起始年份:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT, padx=(15, 8))
         
         self.search_year_from = tk.Entry(
             filter_frame,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             width=6,
             bg=ModernStyle.BG_MAIN,
             relief="flat"
@@ -1285,13 +1671,13 @@ class EconPaperApp:
             text="✨ AI智能筛选",
             variable=self.enable_ai_filter,
             bg=ModernStyle.BG_SECONDARY,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         ).pack(side=tk.LEFT, padx=(20, 8))
         
         tk.Label(
             filter_frame,
             text="💡 英文文献用英文关键词，中文文献用中文关键词",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED
         ).pack(side=tk.RIGHT, padx=12)
@@ -1303,7 +1689,7 @@ class EconPaperApp:
         tk.Label(
             quality_frame,
             text="📊 期刊级别筛选:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM, "bold"),
+            font=ModernStyle.FONT_SM_BOLD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT, padx=(0, 12))
@@ -1314,7 +1700,7 @@ class EconPaperApp:
             text="仅CSSCI/北核",
             variable=self.filter_cssci,
             bg=ModernStyle.BG_SECONDARY,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         ).pack(side=tk.LEFT, padx=8)
         
         self.filter_ssci = tk.BooleanVar(value=False)
@@ -1323,7 +1709,7 @@ class EconPaperApp:
             text="仅SSCI Q1/Q2",
             variable=self.filter_ssci,
             bg=ModernStyle.BG_SECONDARY,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         ).pack(side=tk.LEFT, padx=8)
         
         self.show_rank_info = tk.BooleanVar(value=True)
@@ -1332,13 +1718,13 @@ class EconPaperApp:
             text="显示期刊级别",
             variable=self.show_rank_info,
             bg=ModernStyle.BG_SECONDARY,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         ).pack(side=tk.LEFT, padx=8)
         
         tk.Label(
             quality_frame,
             text="(基于内置期刊数据库，覆盖经管类核心期刊)",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED
         ).pack(side=tk.LEFT, padx=12)
@@ -1370,7 +1756,7 @@ class EconPaperApp:
         ModernButton(
             action_frame,
             text="📥 导出结果",
-            command=lambda: self._export_result(self.search_result.get("1.0", tk.END), "搜索结果"),
+            command=lambda: self._export_result(self.search_dual_output.get_content(), "搜索结果"),
             width=110,
             height=38,
             bg_color=ModernStyle.TEXT_SECONDARY,
@@ -1380,7 +1766,7 @@ class EconPaperApp:
         tk.Label(
             action_frame,
             text="📊 英文：Semantic Scholar + OpenAlex | 中文：百度学术 + 万方数据",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED
         ).pack(side=tk.RIGHT, padx=12)
@@ -1392,14 +1778,14 @@ class EconPaperApp:
         tk.Label(
             result_header,
             text="搜索结果",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(side=tk.LEFT)
         
         self.search_status_label = tk.Label(
             result_header,
             text="",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED
         )
@@ -1434,7 +1820,7 @@ class EconPaperApp:
         content = tk.Frame(page, bg=ModernStyle.BG_MAIN)
         content.pack(fill=tk.BOTH, expand=True, padx=ModernStyle.PADDING_XL, pady=(0, ModernStyle.PADDING_XL))
         
-        paned = tk.PanedWindow(content, orient=tk.HORIZONTAL, bg=ModernStyle.BG_MAIN, sashwidth=8)
+        paned = tk.PanedWindow(content, orient=tk.HORIZONTAL, bg=ModernStyle.BG_MAIN, sashwidth=8, opaqueresize=False)
         paned.pack(fill=tk.BOTH, expand=True)
         
         # 左侧输入
@@ -1443,7 +1829,7 @@ class EconPaperApp:
         tk.Label(
             left_panel,
             text="审稿意见",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(anchor="w", pady=(0, 8))
         
@@ -1454,7 +1840,7 @@ class EconPaperApp:
         tk.Label(
             left_panel,
             text="论文摘要（可选）",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(anchor="w", pady=(0, 8))
         
@@ -1507,7 +1893,7 @@ class EconPaperApp:
         tk.Label(
             right_panel,
             text="回应建议",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(anchor="w", pady=(0, 10))
         
@@ -1539,7 +1925,7 @@ class EconPaperApp:
         content = tk.Frame(page, bg=ModernStyle.BG_MAIN)
         content.pack(fill=tk.BOTH, expand=True, padx=ModernStyle.PADDING_XL, pady=(0, ModernStyle.PADDING_XL))
         
-        paned = tk.PanedWindow(content, orient=tk.HORIZONTAL, bg=ModernStyle.BG_MAIN, sashwidth=8, sashrelief=tk.FLAT)
+        paned = tk.PanedWindow(content, orient=tk.HORIZONTAL, bg=ModernStyle.BG_MAIN, sashwidth=8, sashrelief=tk.FLAT, opaqueresize=False)
         paned.pack(fill=tk.BOTH, expand=True)
         
         # 左侧列表
@@ -1606,7 +1992,7 @@ class EconPaperApp:
         tk.Label(
             detail_header,
             text="记录详情",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(side=tk.LEFT)
         
@@ -1631,41 +2017,38 @@ class EconPaperApp:
         paned.add(right_panel, minsize=400)
         
         self.current_history_record = None
+        self._history_select_job = None  # 防抖中的历史记录加载
         self._refresh_history()
 
     def _refresh_history(self):
         """刷新历史记录列表"""
-        # 清空现有列表
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
+        # 清空现有列表（一次调用删除全部行）
+        children = self.history_tree.get_children()
+        if children:
+            self.history_tree.delete(*children)
             
-        records = self.history.get_recent_records(limit=100)
-        
-        type_map = {
-            "diagnose": "🔍 论文诊断",
-            "optimize": "⚙️ 深度优化",
-            "dedup": "📉 智能降重",
-            "deai": "🤖 降AI痕迹",
-            "deep_process": "⚡ 深度处理",
-            "search": "🔎 学术搜索",
-            "revision": "📝 退修助手"
-        }
+        # 列表只需要预览文本，完整内容在选中时再按 ID 读取
+        records = self.history.get_record_summaries(limit=100)
         
         for r in records:
-            # 格式化时间
-            try:
-                dt = datetime.strptime(r['timestamp'], '%Y-%m-%d %H:%M:%S')
-                time_str = dt.strftime('%m-%d %H:%M')
-            except (ValueError, TypeError, KeyError):
-                time_str = r.get('timestamp', 'N/A')
+            # 格式化时间：SQLite 时间戳格式固定，直接截取 "月-日 时:分"
+            timestamp = r.get('timestamp')
+            time_str = _format_history_ts(timestamp) if isinstance(timestamp, str) else (timestamp or 'N/A')
                 
-            action_name = type_map.get(r['action_type'], r['action_type'])
-            preview = r['output_content'][:100].replace('\n', ' ')
+            action_name = HISTORY_TYPE_LABELS.get(r['action_type'], r['action_type'])
+            preview = (r['preview'] or '').replace('\n', ' ')
             
             self.history_tree.insert("", tk.END, iid=str(r['id']), values=(time_str, action_name, preview))
 
     def _on_history_select(self, event):
-        """选中历史记录"""
+        """选中历史记录：方向键快速移动时只加载最终停留的那一条"""
+        if self._history_select_job is not None:
+            self.root.after_cancel(self._history_select_job)
+        self._history_select_job = self.root.after(50, self._load_history_selection)
+    
+    def _load_history_selection(self):
+        """加载并显示当前选中的历史记录"""
+        self._history_select_job = None
         selection = self.history_tree.selection()
         if not selection:
             return
@@ -1680,7 +2063,8 @@ class EconPaperApp:
             # 显示详情
             self.history_dual_output.set_content(
                 r['output_content'],
-                r['report'] or "无分析报告"
+                r['report'] or "无分析报告",
+                progressive=True
             )
             
             # 显示恢复按钮
@@ -1704,21 +2088,12 @@ class EconPaperApp:
         action_type = r['action_type']
         
         # 映射到页面 ID
-        page_map = {
-            "diagnose": "diagnose",
-            "optimize": "optimize",
-            "dedup": "dedup",
-            "deai": "dedup",
-            "deep_process": "dedup",
-            "search": "search",
-            "revision": "revision"
-        }
-        
-        target_page = page_map.get(action_type)
+        target_page = HISTORY_TARGET_PAGES.get(action_type)
         if not target_page:
             return
             
-        # 填充内容
+        # 填充内容（目标页面可能尚未构建）
+        self._ensure_page(target_page)
         if target_page == "diagnose":
             self.diag_input_comp.set_content(r['input_content'])
             self.diag_dual_output.set_content(r['output_content'], r['report'])
@@ -1758,10 +2133,37 @@ class EconPaperApp:
                 ModernStyle.set_dark_mode(True)
                 ModernStyle.configure_styles(self.root)
             
-            if last_page in self.pages:
+            if last_page in self._page_builders:
                 self._show_page(last_page)
         except Exception:
             pass
+    
+    def _restore_last_search(self):
+        """恢复上次会话的检索结果（超过有效期的不再恢复）"""
+        saved = self.history.get_preference("last_search")
+        if not saved or time.time() - saved.get("saved_at", 0) > LAST_SEARCH_TTL:
+            return
+        results = saved.get("results") or []
+        if not results or self.last_search_results:
+            return
+        
+        self.last_search_results = results
+        query = saved.get("query", "")
+        if query:
+            self.search_query.delete(0, tk.END)
+            self.search_query.insert(0, query)
+        # 经 DualOutputFrame 写入，复制与流转按钮使用的完整内容同步更新
+        self.search_dual_output.set_content(
+            self._format_search_results(results, False),
+            self._search_report(query, saved.get("source", ""), len(results)),
+            progressive=True
+        )
+        self.search_status_label.config(text=f"上次检索: {len(results)} 篇文献")
+    
+    @staticmethod
+    def _search_report(query: str, source: str, count: int) -> str:
+        """检索结果报告文本"""
+        return f"🔍 搜索报告\n\n关键词: {query}\n数据源: {source}\n结果数量: {count}"
 
     def _save_ui_preference(self, key: str, value: Any):
         """保存 UI 偏好设置 (P2)"""
@@ -1785,6 +2187,10 @@ class EconPaperApp:
         self.root.configure(bg=ModernStyle.BG_MAIN)
         self.content_frame.configure(bg=ModernStyle.BG_MAIN)
         
+        # 配色已变化，强制重新应用导航样式
+        self._nav_state.clear()
+        self._update_nav_style()
+        
         # 4. 提示用户
         self.notification.show(f"已切换至{'深色' if is_dark else '浅色'}模式，部分组件重启后效果更佳", "success")
 
@@ -1796,7 +2202,7 @@ class EconPaperApp:
         tk.Label(
             frame,
             text="📋 模板:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=parent.cget("bg"),
             fg=ModernStyle.TEXT_SECONDARY
         ).pack(side=tk.LEFT)
@@ -1815,19 +2221,18 @@ class EconPaperApp:
             values=["选择预设..."],
             state="readonly",
             width=15,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS)
+            font=ModernStyle.FONT_XS
         )
         combo.pack(side=tk.LEFT, padx=5)
         
         # 管理模板按钮
-        manage_btn = tk.Label(
+        manage_btn = make_clickable(tk.Label(
             frame,
             text="⚙️",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=parent.cget("bg"),
-            fg=ModernStyle.TEXT_MUTED,
-            cursor="hand2"
-        )
+            fg=ModernStyle.TEXT_MUTED
+        ))
         manage_btn.pack(side=tk.LEFT, padx=5)
         manage_btn.bind("<Button-1>", lambda e: self._manage_templates(category))
         Tooltip(manage_btn, "管理自定义模板")
@@ -1872,7 +2277,7 @@ class EconPaperApp:
         content_frame = tk.Frame(name_window, bg=ModernStyle.BG_MAIN, padx=20, pady=20)
         content_frame.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(content_frame, text="请输入模板名称:", bg=ModernStyle.BG_MAIN, font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)).pack(anchor="w")
+        tk.Label(content_frame, text="请输入模板名称:", bg=ModernStyle.BG_MAIN, font=ModernStyle.FONT_SM).pack(anchor="w")
         name_entry = tk.Entry(content_frame, width=30)
         name_entry.pack(pady=10)
         name_entry.focus_set()
@@ -1902,7 +2307,7 @@ class EconPaperApp:
         content = tk.Frame(manage_window, bg=ModernStyle.BG_MAIN, padx=20, pady=20)
         content.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(content, text=f"管理模板 - {category}", font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"), bg=ModernStyle.BG_MAIN).pack(anchor="w", pady=(0, 10))
+        tk.Label(content, text=f"管理模板 - {category}", font=ModernStyle.FONT_MD_BOLD, bg=ModernStyle.BG_MAIN).pack(anchor="w", pady=(0, 10))
         
         # 列表
         list_frame = tk.Frame(content, bg=ModernStyle.BG_MAIN)
@@ -1978,7 +2383,8 @@ class EconPaperApp:
         canvas.configure(yscrollcommand=scrollbar.set)
         
         def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            if canvas.winfo_exists():
+                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -1996,7 +2402,7 @@ class EconPaperApp:
         tk.Label(
             header1,
             text="🤖 语言模型配置 (LLM)",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_LG, "bold"),
+            font=ModernStyle.FONT_LG_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT)
@@ -2023,7 +2429,7 @@ class EconPaperApp:
         tk.Label(
             row1,
             text="供应商:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
@@ -2039,7 +2445,7 @@ class EconPaperApp:
             values=providers,
             state="readonly",
             width=25,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         )
         provider_combo.pack(side=tk.LEFT, padx=12)
         provider_combo.bind("<<ComboboxSelected>>", self._on_llm_provider_change)
@@ -2047,7 +2453,7 @@ class EconPaperApp:
         tk.Label(
             row1,
             text="💡 切换供应商自动填充 API 地址",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED
         ).pack(side=tk.LEFT, padx=18)
@@ -2059,7 +2465,7 @@ class EconPaperApp:
         tk.Label(
             row2,
             text="API 地址:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
@@ -2068,7 +2474,7 @@ class EconPaperApp:
         
         self.setting_llm_base = tk.Entry(
             row2,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             relief="flat",
             width=55
@@ -2082,7 +2488,7 @@ class EconPaperApp:
         tk.Label(
             row3,
             text="API 密钥:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
@@ -2091,7 +2497,7 @@ class EconPaperApp:
         
         self.setting_llm_key = tk.Entry(
             row3,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             relief="flat",
             width=45,
@@ -2106,7 +2512,7 @@ class EconPaperApp:
             variable=self.show_llm_key,
             command=lambda: self.setting_llm_key.config(show="" if self.show_llm_key.get() else "•"),
             bg=ModernStyle.BG_SECONDARY,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         ).pack(side=tk.LEFT, padx=12)
         
         # 模型选择
@@ -2116,7 +2522,7 @@ class EconPaperApp:
         tk.Label(
             row4,
             text="模型名称:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
@@ -2125,10 +2531,9 @@ class EconPaperApp:
         
         self.setting_llm_model = ttk.Combobox(
             row4,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             width=35,
-            values=["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "deepseek-chat", "deepseek-coder", 
-                   "Qwen/Qwen2.5-72B-Instruct", "claude-3-5-sonnet-20241022"]
+            values=LLM_MODEL_OPTIONS
         )
         self.setting_llm_model.pack(side=tk.LEFT, padx=12)
         
@@ -2147,7 +2552,7 @@ class EconPaperApp:
         self.llm_status = tk.Label(
             row4,
             text="● 未配置",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.WARNING
         )
@@ -2163,7 +2568,7 @@ class EconPaperApp:
         tk.Label(
             header2,
             text="📊 嵌入模型配置 (Embedding)",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_LG, "bold"),
+            font=ModernStyle.FONT_LG_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT)
@@ -2172,90 +2577,93 @@ class EconPaperApp:
         self.enable_embedding = tk.BooleanVar(value=False)
         
         self.use_same_api = tk.BooleanVar(value=True)
+        self._last_embed_mode = None  # 设置页可能被回收重建，重置缓存的显示状态
         tk.Checkbutton(
             header2,
             text="使用与语言模型相同的 API 配置",
             variable=self.use_same_api,
             command=self._toggle_embed_api,
             bg=ModernStyle.BG_MAIN,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         ).pack(side=tk.RIGHT)
         
         self.embed_frame = tk.Frame(section2, bg=ModernStyle.BG_SECONDARY, padx=25, pady=25)
         self.embed_frame.pack(fill=tk.X)
         
+        # 独立 API 配置（地址 + 密钥），预先构建，切换时仅显示/隐藏
+        self._embed_indep_frame = tk.Frame(self.embed_frame, bg=ModernStyle.BG_SECONDARY)
+        
         # 嵌入模型 API 地址
-        row_e1 = tk.Frame(self.embed_frame, bg=ModernStyle.BG_SECONDARY)
+        row_e1 = tk.Frame(self._embed_indep_frame, bg=ModernStyle.BG_SECONDARY)
         row_e1.pack(fill=tk.X, pady=10)
         
         tk.Label(
             row_e1,
             text="API 地址:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
             anchor="w"
-        ).pack(side=tk.LEFT)
+        ).grid(row=0, column=0, sticky="w")
         
         self.setting_embed_base = tk.Entry(
             row_e1,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             relief="flat",
             width=55
         )
-        self.setting_embed_base.pack(side=tk.LEFT, padx=12, ipady=8)
+        self.setting_embed_base.grid(row=0, column=1, padx=12, ipady=8)
         
         # 嵌入模型 API 密钥
-        row_e2 = tk.Frame(self.embed_frame, bg=ModernStyle.BG_SECONDARY)
+        row_e2 = tk.Frame(self._embed_indep_frame, bg=ModernStyle.BG_SECONDARY)
         row_e2.pack(fill=tk.X, pady=10)
         
         tk.Label(
             row_e2,
             text="API 密钥:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
             anchor="w"
-        ).pack(side=tk.LEFT)
+        ).grid(row=0, column=0, sticky="w")
         
         self.setting_embed_key = tk.Entry(
             row_e2,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             relief="flat",
             width=45,
             show="•"
         )
-        self.setting_embed_key.pack(side=tk.LEFT, padx=12, ipady=8)
+        self.setting_embed_key.grid(row=0, column=1, padx=12, ipady=8)
         
-        # 嵌入模型选择
-        row_e3 = tk.Frame(self.embed_frame, bg=ModernStyle.BG_SECONDARY)
-        row_e3.pack(fill=tk.X, pady=10)
+        # 嵌入模型选择（两种模式共用）
+        self._embed_model_row = tk.Frame(self.embed_frame, bg=ModernStyle.BG_SECONDARY)
+        self._embed_model_row.pack(fill=tk.X, pady=10)
         
         tk.Label(
-            row_e3,
+            self._embed_model_row,
             text="模型名称:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
             anchor="w"
-        ).pack(side=tk.LEFT)
+        ).grid(row=0, column=0, sticky="w")
         
         self.setting_embed_model = ttk.Combobox(
-            row_e3,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            self._embed_model_row,
+            font=ModernStyle.FONT_SM,
             width=35,
-            values=["text-embedding-3-small", "text-embedding-3-large", "text-embedding-ada-002",
-                   "BAAI/bge-m3", "BAAI/bge-large-zh-v1.5"]
+            values=EMBED_MODEL_OPTIONS
         )
-        self.setting_embed_model.pack(side=tk.LEFT, padx=12)
+        self.setting_embed_model.grid(row=0, column=1, padx=12)
         
         ModernButton(
-            row_e3,
+            self._embed_model_row,
             text="📥 拉取模型列表",
             command=self._fetch_embed_models,
             width=140,
@@ -2264,7 +2672,16 @@ class EconPaperApp:
             hover_color=ModernStyle.BG_HOVER,
             text_color=ModernStyle.TEXT_PRIMARY,
             tooltip="获取可用嵌入模型"
-        ).pack(side=tk.LEFT, padx=12)
+        ).grid(row=0, column=2, padx=12)
+        
+        # 使用相同 API 时的提示
+        self._embed_same_hint = tk.Label(
+            self._embed_model_row,
+            text="💡 将使用语言模型的 API 地址和密钥",
+            font=ModernStyle.FONT_XS,
+            bg=ModernStyle.BG_SECONDARY,
+            fg=ModernStyle.TEXT_MUTED
+        )
         
         # 初始状态：隐藏独立配置
         self._toggle_embed_api()
@@ -2279,7 +2696,7 @@ class EconPaperApp:
         tk.Label(
             header3,
             text="📁 数据存储配置",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_LG, "bold"),
+            font=ModernStyle.FONT_LG_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT)
@@ -2287,7 +2704,7 @@ class EconPaperApp:
         tk.Label(
             header3,
             text="💡 自定义存储位置可避免占用C盘空间",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED
         ).pack(side=tk.RIGHT)
@@ -2302,21 +2719,21 @@ class EconPaperApp:
         tk.Label(
             row_s1,
             text="数据目录:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
             anchor="w"
-        ).pack(side=tk.LEFT)
+        ).grid(row=0, column=0, sticky="w")
         
         self.setting_data_dir = tk.Entry(
             row_s1,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             relief="flat",
             width=45
         )
-        self.setting_data_dir.pack(side=tk.LEFT, padx=12, ipady=8)
+        self.setting_data_dir.grid(row=0, column=1, padx=12, ipady=8)
         
         ModernButton(
             row_s1,
@@ -2327,15 +2744,15 @@ class EconPaperApp:
             bg_color=ModernStyle.BG_MAIN,
             hover_color=ModernStyle.BG_HOVER,
             text_color=ModernStyle.TEXT_PRIMARY
-        ).pack(side=tk.LEFT, padx=8)
+        ).grid(row=0, column=2, padx=8)
         
         tk.Label(
             row_s1,
             text="(日志、缓存、向量库)",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED
-        ).pack(side=tk.LEFT, padx=8)
+        ).grid(row=0, column=3, sticky="w", padx=8)
         
         # 工作区目录
         row_s2 = tk.Frame(storage_frame, bg=ModernStyle.BG_SECONDARY)
@@ -2344,21 +2761,21 @@ class EconPaperApp:
         tk.Label(
             row_s2,
             text="工作区目录:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
             anchor="w"
-        ).pack(side=tk.LEFT)
+        ).grid(row=0, column=0, sticky="w")
         
         self.setting_workspace_dir = tk.Entry(
             row_s2,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             relief="flat",
             width=45
         )
-        self.setting_workspace_dir.pack(side=tk.LEFT, padx=12, ipady=8)
+        self.setting_workspace_dir.grid(row=0, column=1, padx=12, ipady=8)
         
         ModernButton(
             row_s2,
@@ -2369,15 +2786,15 @@ class EconPaperApp:
             bg_color=ModernStyle.BG_MAIN,
             hover_color=ModernStyle.BG_HOVER,
             text_color=ModernStyle.TEXT_PRIMARY
-        ).pack(side=tk.LEFT, padx=8)
+        ).grid(row=0, column=2, padx=8)
         
         tk.Label(
             row_s2,
             text="(导出文件存放位置)",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED
-        ).pack(side=tk.LEFT, padx=8)
+        ).grid(row=0, column=3, sticky="w", padx=8)
         
         # 当前存储位置显示
         row_s3 = tk.Frame(storage_frame, bg=ModernStyle.BG_SECONDARY)
@@ -2386,7 +2803,7 @@ class EconPaperApp:
         self.storage_info_label = tk.Label(
             row_s3,
             text="",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+            font=ModernStyle.FONT_XS,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_MUTED,
             wraplength=600,
@@ -2407,7 +2824,7 @@ class EconPaperApp:
         tk.Label(
             header_ui,
             text="🎨 界面外观配置",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_LG, "bold"),
+            font=ModernStyle.FONT_LG_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT)
@@ -2421,21 +2838,21 @@ class EconPaperApp:
         tk.Label(
             row_ui1,
             text="深色模式:",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             width=12,
             anchor="w"
         ).pack(side=tk.LEFT)
         
-        self.dark_mode_var = tk.BooleanVar(value=False)
+        self.dark_mode_var = tk.BooleanVar(value=ModernStyle.IS_DARK)
         tk.Checkbutton(
             row_ui1,
             text="开启深色主题",
             variable=self.dark_mode_var,
             command=self._on_dark_mode_toggle,
             bg=ModernStyle.BG_SECONDARY,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SM
         ).pack(side=tk.LEFT, padx=12)
 
         # ============ 5. API 用量统计 (P2) ============
@@ -2448,7 +2865,7 @@ class EconPaperApp:
         tk.Label(
             header4,
             text="📈 API 用量统计",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_LG, "bold"),
+            font=ModernStyle.FONT_LG_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT)
@@ -2470,7 +2887,7 @@ class EconPaperApp:
         self.usage_label = tk.Label(
             self.usage_frame,
             text="正在加载统计信息...",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_SECONDARY,
             fg=ModernStyle.TEXT_PRIMARY,
             justify="left"
@@ -2504,152 +2921,18 @@ class EconPaperApp:
         self._load_settings()
     
     def _toggle_embed_api(self):
-        """切换嵌入模型配置显示"""
-        # 保存当前输入值（如果存在）
-        saved_embed_base = ""
-        saved_embed_key = ""
-        saved_embed_model = ""
-        
-        if hasattr(self, 'setting_embed_base') and hasattr(self.setting_embed_base, 'winfo_exists'):
-            try:
-                if self.setting_embed_base.winfo_exists():
-                    saved_embed_base = self.setting_embed_base.get()
-            except Exception:
-                pass
-        if hasattr(self, 'setting_embed_key') and hasattr(self.setting_embed_key, 'winfo_exists'):
-            try:
-                if self.setting_embed_key.winfo_exists():
-                    saved_embed_key = self.setting_embed_key.get()
-            except Exception:
-                pass
-        if hasattr(self, 'setting_embed_model'):
-            try:
-                saved_embed_model = self.setting_embed_model.get()
-            except Exception:
-                pass
-        
-        # 清除现有内容
-        for widget in self.embed_frame.winfo_children():
-            if isinstance(widget, tk.Frame):
-                widget.destroy()
-        
+        """切换嵌入模型配置显示（控件已预先构建，仅切换显示，输入值自然保留）"""
         # 嵌入模型为可选功能，默认使用语言模型的 API
-        if self.use_same_api.get():
-            # 使用相同API - 只显示模型选择
-            row_e3 = tk.Frame(self.embed_frame, bg=ModernStyle.BG_SECONDARY)
-            row_e3.pack(fill=tk.X, pady=10)
-            
-            tk.Label(
-                row_e3,
-                text="模型名称:",
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                bg=ModernStyle.BG_SECONDARY,
-                fg=ModernStyle.TEXT_PRIMARY,
-                width=12,
-                anchor="w"
-            ).pack(side=tk.LEFT)
-            
-            self.setting_embed_model = ttk.Combobox(
-                row_e3,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
-                width=35,
-                values=["text-embedding-3-small", "text-embedding-3-large", "BAAI/bge-m3"]
-            )
-            self.setting_embed_model.pack(side=tk.LEFT, padx=12)
-            
-            # 恢复保存的模型值
-            if saved_embed_model:
-                self.setting_embed_model.set(saved_embed_model)
-            
-            tk.Label(
-                row_e3,
-                text="💡 将使用语言模型的 API 地址和密钥",
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
-                bg=ModernStyle.BG_SECONDARY,
-                fg=ModernStyle.TEXT_MUTED
-            ).pack(side=tk.LEFT, padx=18)
+        mode = self.use_same_api.get()
+        if mode == self._last_embed_mode:
+            return
+        self._last_embed_mode = mode
+        if mode:
+            self._embed_indep_frame.pack_forget()
+            self._embed_same_hint.grid(row=0, column=3, sticky="w", padx=18)
         else:
-            # 使用独立API - 显示完整配置
-            # API 地址
-            row_e1 = tk.Frame(self.embed_frame, bg=ModernStyle.BG_SECONDARY)
-            row_e1.pack(fill=tk.X, pady=10)
-            
-            tk.Label(
-                row_e1,
-                text="API 地址:",
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                bg=ModernStyle.BG_SECONDARY,
-                fg=ModernStyle.TEXT_PRIMARY,
-                width=12,
-                anchor="w"
-            ).pack(side=tk.LEFT)
-            
-            self.setting_embed_base = tk.Entry(
-                row_e1,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                bg=ModernStyle.BG_MAIN,
-                relief="flat",
-                width=55
-            )
-            self.setting_embed_base.pack(side=tk.LEFT, padx=12, ipady=8)
-            
-            # 恢复保存的值
-            if saved_embed_base:
-                self.setting_embed_base.insert(0, saved_embed_base)
-            
-            # API 密钥
-            row_e2 = tk.Frame(self.embed_frame, bg=ModernStyle.BG_SECONDARY)
-            row_e2.pack(fill=tk.X, pady=10)
-            
-            tk.Label(
-                row_e2,
-                text="API 密钥:",
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                bg=ModernStyle.BG_SECONDARY,
-                fg=ModernStyle.TEXT_PRIMARY,
-                width=12,
-                anchor="w"
-            ).pack(side=tk.LEFT)
-            
-            self.setting_embed_key = tk.Entry(
-                row_e2,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                bg=ModernStyle.BG_MAIN,
-                relief="flat",
-                width=45,
-                show="•"
-            )
-            self.setting_embed_key.pack(side=tk.LEFT, padx=12, ipady=8)
-            
-            # 恢复保存的值
-            if saved_embed_key:
-                self.setting_embed_key.insert(0, saved_embed_key)
-            
-            # 模型选择
-            row_e3 = tk.Frame(self.embed_frame, bg=ModernStyle.BG_SECONDARY)
-            row_e3.pack(fill=tk.X, pady=10)
-            
-            tk.Label(
-                row_e3,
-                text="模型名称:",
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                bg=ModernStyle.BG_SECONDARY,
-                fg=ModernStyle.TEXT_PRIMARY,
-                width=12,
-                anchor="w"
-            ).pack(side=tk.LEFT)
-            
-            self.setting_embed_model = ttk.Combobox(
-                row_e3,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
-                width=35,
-                values=["text-embedding-3-small", "text-embedding-3-large", "BAAI/bge-m3"]
-            )
-            self.setting_embed_model.pack(side=tk.LEFT, padx=12)
-            
-            # 恢复保存的模型值
-            if saved_embed_model:
-                self.setting_embed_model.set(saved_embed_model)
+            self._embed_same_hint.grid_remove()
+            self._embed_indep_frame.pack(fill=tk.X, before=self._embed_model_row)
     
     def _on_llm_provider_change(self, event=None):
         """切换供应商时自动填充"""
@@ -2665,8 +2948,7 @@ class EconPaperApp:
         
         if provider in presets:
             base, model, embed = presets[provider]
-            self.setting_llm_base.delete(0, tk.END)
-            self.setting_llm_base.insert(0, base)
+            self._set_entry(self.setting_llm_base, base)
             self.setting_llm_model.set(model)
             self.setting_embed_model.set(embed)
     
@@ -2680,20 +2962,16 @@ class EconPaperApp:
             return
         
         def do_fetch(check_cancel):
-            if OpenAI is None:
-                raise ImportError("未安装 openai 库")
-            client = OpenAI(base_url=api_base, api_key=api_key)
-            models = client.models.list()
-            
-            model_ids = [m.id for m in models.data]
-            model_ids.sort()
-            return model_ids
+            return _cached_models_list(api_base, api_key)
         
         def on_complete(model_ids):
             self.setting_llm_model.config(values=model_ids)
             self.notification.show(f"成功获取到 {len(model_ids)} 个模型", "success")
+        
+        def on_error(e):
+            self.notification.show(f"获取模型列表失败: {e}", "error")
             
-        self.task_manager.submit(do_fetch, on_complete=on_complete, task_name="fetch_models")
+        self.task_manager.submit(do_fetch, on_complete=on_complete, on_error=on_error, task_name="fetch_models")
     
     def _fetch_embed_models(self):
         """拉取嵌入模型列表"""
@@ -2709,13 +2987,8 @@ class EconPaperApp:
             return
         
         def do_fetch(check_cancel):
-            if OpenAI is None:
-                raise ImportError("未安装 openai 库")
-            client = OpenAI(base_url=api_base, api_key=api_key)
-            models = client.models.list()
-            embed_ids = [m.id for m in models.data if 'embed' in m.id.lower() or 'bge' in m.id.lower()]
-            embed_ids.sort()
-            return embed_ids
+            # 缓存的模型列表已排序，过滤后仍保持有序
+            return [m for m in _cached_models_list(api_base, api_key) if _EMBED_RE.search(m)]
         
         def on_complete(embed_ids):
             if embed_ids:
@@ -2723,8 +2996,11 @@ class EconPaperApp:
                 self.notification.show(f"成功获取到 {len(embed_ids)} 个嵌入模型", "success")
             else:
                 self.notification.show("未找到嵌入模型，请手动输入", "warning")
+        
+        def on_error(e):
+            self.notification.show(f"获取嵌入模型列表失败: {e}", "error")
             
-        self.task_manager.submit(do_fetch, on_complete=on_complete, task_name="fetch_embed_models")
+        self.task_manager.submit(do_fetch, on_complete=on_complete, on_error=on_error, task_name="fetch_embed_models")
     
     def _test_llm_connection(self):
         """测试语言模型连接"""
@@ -2737,9 +3013,7 @@ class EconPaperApp:
             return
         
         def do_test(check_cancel):
-            if OpenAI is None:
-                raise ImportError("未安装 openai 库")
-            client = OpenAI(base_url=api_base, api_key=api_key)
+            client = _get_openai_client(api_base, api_key)
             client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": "Hi"}],
@@ -2762,24 +3036,29 @@ class EconPaperApp:
         directory = filedialog.askdirectory(title="选择目录")
         if directory:
             if target == "data_dir":
-                self.setting_data_dir.delete(0, tk.END)
-                self.setting_data_dir.insert(0, directory)
+                self._set_entry(self.setting_data_dir, directory)
             elif target == "workspace_dir":
-                self.setting_workspace_dir.delete(0, tk.END)
-                self.setting_workspace_dir.insert(0, directory)
+                self._set_entry(self.setting_workspace_dir, directory)
     
     def _update_storage_info(self):
-        """更新存储位置信息显示"""
+        """更新存储位置信息显示（合并到一次空闲回调中执行）"""
+        if self._pending_storage_update:
+            return
+        self._pending_storage_update = True
+        self.root.after_idle(self._do_storage_update)
+    
+    def _do_storage_update(self):
+        """执行存储位置信息的实际更新"""
+        self._pending_storage_update = False
+        if "settings" not in self.pages:
+            return
         try:
-            from config.settings import settings
             info_text = f"📍 当前数据目录: {settings.data_dir}\n📍 当前工作区: {settings.workspace_dir}"
             self.storage_info_label.config(text=info_text)
             
             # 填充输入框
-            self.setting_data_dir.delete(0, tk.END)
-            self.setting_data_dir.insert(0, settings.data_dir)
-            self.setting_workspace_dir.delete(0, tk.END)
-            self.setting_workspace_dir.insert(0, settings.workspace_dir)
+            self._set_entry(self.setting_data_dir, settings.data_dir)
+            self._set_entry(self.setting_workspace_dir, settings.workspace_dir)
         except Exception:
             pass
     
@@ -2799,49 +3078,57 @@ class EconPaperApp:
             self.setting_llm_base.delete(0, tk.END)
             self.setting_llm_key.delete(0, tk.END)
             self.setting_llm_model.set("")
-            # 安全访问嵌入模型控件
-            if hasattr(self, 'setting_embed_base') and hasattr(self.setting_embed_base, 'winfo_exists') and self.setting_embed_base.winfo_exists():
-                self.setting_embed_base.delete(0, tk.END)
-            if hasattr(self, 'setting_embed_key') and hasattr(self.setting_embed_key, 'winfo_exists') and self.setting_embed_key.winfo_exists():
-                self.setting_embed_key.delete(0, tk.END)
-            if hasattr(self, 'setting_embed_model'):
-                self.setting_embed_model.set("")
+            self.setting_embed_base.delete(0, tk.END)
+            self.setting_embed_key.delete(0, tk.END)
+            self.setting_embed_model.set("")
             # 重置存储目录
-            if hasattr(self, 'setting_data_dir'):
-                self.setting_data_dir.delete(0, tk.END)
-            if hasattr(self, 'setting_workspace_dir'):
-                self.setting_workspace_dir.delete(0, tk.END)
+            self.setting_data_dir.delete(0, tk.END)
+            self.setting_workspace_dir.delete(0, tk.END)
             self.llm_provider_var.set("OpenAI 兼容")
             self.llm_status.config(text="● 未配置", fg=ModernStyle.WARNING)
+            # 只清空表单；已保存的配置在再次保存前仍然有效，api_configured 保持不变
     
     def _check_first_run(self):
         """首次运行检查 - 引导用户配置API"""
-        try:
-            from config.settings import settings
-            if not settings.llm_api_key or not settings.llm_api_base:
-                self.api_configured = False
-                self._show_first_run_guide()
-            else:
-                self.api_configured = True
-        except Exception:
-            self.api_configured = False
+        self.api_configured = bool(settings.llm_api_key and settings.llm_api_base)
+        if not self.api_configured:
             self._show_first_run_guide()
     
+    def _present_dialog(self, window: tk.Toplevel, width: int, height: int):
+        """显示已缓存的对话框窗口并居中"""
+        window.deiconify()
+        window.update_idletasks()
+        x = (window.winfo_screenwidth() - width) // 2
+        y = (window.winfo_screenheight() - height) // 2
+        window.geometry(f"{width}x{height}+{x}+{y}")
+        window.lift()
+        window.grab_set()
+    
+    def _hide_dialog(self, window: tk.Toplevel):
+        """隐藏对话框窗口（保留控件以便下次直接显示）"""
+        window.grab_release()
+        window.withdraw()
+    
+    def _create_dialog_window(self, title: str) -> tk.Toplevel:
+        """创建初始隐藏、关闭时仅隐藏的对话框窗口"""
+        window = tk.Toplevel(self.root)
+        window.withdraw()
+        window.title(title)
+        window.resizable(False, False)
+        window.configure(bg=ModernStyle.BG_MAIN)
+        window.transient(self.root)
+        window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(window))
+        return window
+    
     def _show_first_run_guide(self):
-        """显示首次使用引导"""
-        guide_window = tk.Toplevel(self.root)
-        guide_window.title("🎉 欢迎使用 EconPaper Pro")
-        guide_window.geometry("550x450")
-        guide_window.resizable(False, False)
-        guide_window.configure(bg=ModernStyle.BG_MAIN)
-        guide_window.transient(self.root)
-        guide_window.grab_set()
-        
-        # 居中显示
-        guide_window.update_idletasks()
-        x = (guide_window.winfo_screenwidth() - 550) // 2
-        y = (guide_window.winfo_screenheight() - 450) // 2
-        guide_window.geometry(f"+{x}+{y}")
+        """显示首次使用引导（窗口首次显示时创建，之后复用）"""
+        if self._first_run_win is None or not self._first_run_win.winfo_exists():
+            self._first_run_win = self._build_first_run_guide()
+        self._present_dialog(self._first_run_win, 550, 450)
+    
+    def _build_first_run_guide(self) -> tk.Toplevel:
+        """构建首次使用引导窗口"""
+        guide_window = self._create_dialog_window("🎉 欢迎使用 EconPaper Pro")
         
         # 内容
         content = tk.Frame(guide_window, bg=ModernStyle.BG_MAIN, padx=40, pady=30)
@@ -2850,7 +3137,7 @@ class EconPaperApp:
         tk.Label(
             content,
             text="🎉 欢迎使用 EconPaper Pro!",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XL, "bold"),
+            font=ModernStyle.FONT_XL_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(pady=(0, 20))
@@ -2858,7 +3145,7 @@ class EconPaperApp:
         tk.Label(
             content,
             text="检测到您还未配置 AI 模型，请先完成以下设置：",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_SECONDARY
         ).pack(pady=(0, 25))
@@ -2878,7 +3165,7 @@ class EconPaperApp:
             tk.Label(
                 step_frame,
                 text=icon,
-                font=(ModernStyle.FONT_FAMILY, 16),
+                font=ModernStyle.FONT_ICON,
                 bg=ModernStyle.BG_SECONDARY
             ).pack(side=tk.LEFT, padx=(0, 12))
             
@@ -2888,7 +3175,7 @@ class EconPaperApp:
             tk.Label(
                 text_frame,
                 text=title,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+                font=ModernStyle.FONT_MD_BOLD,
                 bg=ModernStyle.BG_SECONDARY,
                 fg=ModernStyle.TEXT_PRIMARY,
                 anchor="w"
@@ -2897,7 +3184,7 @@ class EconPaperApp:
             tk.Label(
                 text_frame,
                 text=desc,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XS),
+                font=ModernStyle.FONT_XS,
                 bg=ModernStyle.BG_SECONDARY,
                 fg=ModernStyle.TEXT_MUTED,
                 anchor="w"
@@ -2908,7 +3195,7 @@ class EconPaperApp:
         btn_frame.pack(fill=tk.X, pady=(25, 0))
         
         def go_to_settings():
-            guide_window.destroy()
+            self._hide_dialog(guide_window)
             self._show_page("settings")
         
         ModernButton(
@@ -2922,29 +3209,25 @@ class EconPaperApp:
         ModernButton(
             btn_frame,
             text="稍后配置",
-            command=guide_window.destroy,
+            command=lambda: self._hide_dialog(guide_window),
             width=120,
             height=45,
             bg_color=ModernStyle.BG_SECONDARY,
             hover_color=ModernStyle.BG_HOVER,
             text_color=ModernStyle.TEXT_PRIMARY
         ).pack(side=tk.LEFT, padx=15)
+        
+        return guide_window
     
     def _show_about_dialog(self):
-        """显示关于对话框"""
-        about_window = tk.Toplevel(self.root)
-        about_window.title("关于 EconPaper Pro")
-        about_window.geometry("450x380")
-        about_window.resizable(False, False)
-        about_window.configure(bg=ModernStyle.BG_MAIN)
-        about_window.transient(self.root)
-        about_window.grab_set()
-        
-        # 居中显示
-        about_window.update_idletasks()
-        x = (about_window.winfo_screenwidth() - 450) // 2
-        y = (about_window.winfo_screenheight() - 380) // 2
-        about_window.geometry(f"+{x}+{y}")
+        """显示关于对话框（窗口首次显示时创建，之后复用）"""
+        if self._about_win is None or not self._about_win.winfo_exists():
+            self._about_win = self._build_about_dialog()
+        self._present_dialog(self._about_win, 450, 380)
+    
+    def _build_about_dialog(self) -> tk.Toplevel:
+        """构建关于对话框窗口"""
+        about_window = self._create_dialog_window("关于 EconPaper Pro")
         
         content = tk.Frame(about_window, bg=ModernStyle.BG_MAIN, padx=40, pady=30)
         content.pack(fill=tk.BOTH, expand=True)
@@ -2960,7 +3243,7 @@ class EconPaperApp:
         tk.Label(
             content,
             text="EconPaper Pro",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_XL, "bold"),
+            font=ModernStyle.FONT_XL_BOLD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY
         ).pack(pady=(10, 5))
@@ -2968,7 +3251,7 @@ class EconPaperApp:
         tk.Label(
             content,
             text=f"版本 {VERSION}",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
+            font=ModernStyle.FONT_MD,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_SECONDARY
         ).pack()
@@ -2976,7 +3259,7 @@ class EconPaperApp:
         tk.Label(
             content,
             text="经管学术论文智能助手",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_MUTED
         ).pack(pady=(15, 20))
@@ -2986,7 +3269,7 @@ class EconPaperApp:
         tk.Label(
             content,
             text=features,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_MAIN,
             fg=ModernStyle.TEXT_PRIMARY,
             justify="center"
@@ -2996,58 +3279,57 @@ class EconPaperApp:
         link_frame = tk.Frame(content, bg=ModernStyle.BG_MAIN)
         link_frame.pack()
         
-        tk.Label(
+        make_clickable(tk.Label(
             link_frame,
             text="📖 使用帮助",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_MAIN,
-            fg=ModernStyle.PRIMARY,
-            cursor="hand2"
-        ).pack(side=tk.LEFT, padx=15)
+            fg=ModernStyle.PRIMARY
+        )).pack(side=tk.LEFT, padx=15)
         
-        tk.Label(
+        make_clickable(tk.Label(
             link_frame,
             text="🐛 反馈问题",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             bg=ModernStyle.BG_MAIN,
-            fg=ModernStyle.PRIMARY,
-            cursor="hand2"
-        ).pack(side=tk.LEFT, padx=15)
+            fg=ModernStyle.PRIMARY
+        )).pack(side=tk.LEFT, padx=15)
         
         # 关闭按钮
         ModernButton(
             content,
             text="关闭",
-            command=about_window.destroy,
+            command=lambda: self._hide_dialog(about_window),
             width=100,
             height=40,
             bg_color=ModernStyle.BG_SECONDARY,
             hover_color=ModernStyle.BG_HOVER,
             text_color=ModernStyle.TEXT_PRIMARY
         ).pack(pady=(20, 0))
+        
+        return about_window
     
     def _check_api_before_action(self, action_name: str) -> bool:
         """执行操作前检查 API 配置"""
-        if not self.api_configured:
-            try:
-                from config.settings import settings
-                if settings.llm_api_key and settings.llm_api_base:
-                    self.api_configured = True
-                    return True
-            except Exception:
-                pass
-            
-            result = ConfirmDialog.show(
-                self.root,
-                "需要配置 API",
-                f"使用「{action_name}」功能需要先配置 AI 模型。\n\n是否现在前往设置？",
-                confirm_text="前往设置",
-                cancel_text="稍后再说"
-            )
-            if result:
-                self._show_page("settings")
-            return False
-        return True
+        if self.api_configured:
+            return True
+        
+        # 未配置时才检查 .env 是否在外部被修改（未修改时只是一次 stat）
+        self._refresh_settings_if_changed()
+        if settings.llm_api_key and settings.llm_api_base:
+            self.api_configured = True
+            return True
+        
+        result = ConfirmDialog.show(
+            self.root,
+            "需要配置 API",
+            f"使用「{action_name}」功能需要先配置 AI 模型。\n\n是否现在前往设置？",
+            confirm_text="前往设置",
+            cancel_text="稍后再说"
+        )
+        if result:
+            self._show_page("settings")
+        return False
     
     # ==================== 核心功能方法 ====================
     
@@ -3071,20 +3353,35 @@ class EconPaperApp:
             initialfile=f"{default_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         )
         
-        if file_path:
+        if not file_path:
+            return
+        
+        if file_path.lower().endswith(".docx"):
             try:
-                if file_path.lower().endswith(".docx"):
-                    self._export_as_docx(content, file_path, default_name)
-                else:
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    self.notification.show(f"已导出到: {os.path.basename(file_path)}", "success")
+                self._export_as_docx(content, file_path, default_name)
             except Exception as e:
                 self.notification.show(f"导出失败: {e}", "error")
+            return
+        
+        def do_export(check_cancel):
+            # 一次性编码后按二进制写入，避免文本 IO 层在 UI 线程上逐段编码
+            data = content.encode("utf-8")
+            with open(file_path, "wb") as f:
+                f.write(data)
+            return file_path
+        
+        self.task_manager.submit(
+            do_export,
+            on_complete=lambda path: self.notification.show(
+                f"已导出到: {os.path.basename(path)}", "success"),
+            on_error=lambda e: self.notification.show(f"导出失败: {e}", "error"),
+            task_name="export"
+        )
 
     def _export_as_docx(self, content: str, file_path: str, title: str):
         """将内容导出为专业 Word 文档 (P3)"""
-        if not HAS_DOCX:
+        docx = _docx()
+        if docx is None:
             self.notification.show("未安装 python-docx 库，无法导出 Word 格式", "error")
             return
             
@@ -3135,18 +3432,47 @@ class EconPaperApp:
             count = len(file_paths)
             first_name = os.path.basename(file_paths[0])
             display_text = f"✓ {first_name}" + (f" 等 {count} 个文件" if count > 1 else "")
+            # 文件类型在选择时确定一次，运行时直接使用
+            file_infos = [
+                (fp, "pdf" if fp.lower().endswith(".pdf") else "docx") for fp in file_paths
+            ]
             
             if target == "diagnose":
                 self.diag_file_paths = list(file_paths)
+                self.diag_file_infos = file_infos
                 self.diag_file_path = file_paths[0] # 保持兼容性
                 self.diag_file_label.config(text=display_text, fg=ModernStyle.SUCCESS)
             elif target == "optimize":
                 self.opt_file_paths = list(file_paths)
+                self.opt_file_infos = file_infos
                 self.opt_file_path = file_paths[0] # 保持兼容性
                 self.opt_file_label.config(text=display_text, fg=ModernStyle.SUCCESS)
             elif target == "dedup":
                 self.dedup_file_paths = list(file_paths)
                 self.dedup_file_label.config(text=display_text, fg=ModernStyle.SUCCESS)
+            
+            if target in ("diagnose", "optimize"):
+                self._prefetch_files(target, file_infos)
+    
+    def _prefetch_files(self, target: str, file_infos: List[Tuple[str, str]]):
+        """选择文件后在后台预先解析，结果写入文件缓存，点击运行时可直接使用"""
+        previous = self._prefetch_tasks.pop(target, None)
+        if previous is not None:
+            self.task_manager.cancel(previous)
+        
+        def do_prefetch(check_cancel):
+            for f_path, f_type in file_infos[:FILE_CACHE_SIZE]:
+                if check_cancel():
+                    return
+                try:
+                    self._read_paper_text(f_path, f_type, check_cancel)
+                except Exception:
+                    # 预解析失败不提示，正式运行时会重新解析并报告错误
+                    pass
+        
+        self._prefetch_tasks[target] = self.task_manager.submit(
+            do_prefetch, task_name=f"prefetch_{target}", background=True
+        )
     
     def _set_result(self, widget: scrolledtext.ScrolledText, text: str):
         """设置结果文本"""
@@ -3157,6 +3483,107 @@ class EconPaperApp:
             widget.config(state=tk.DISABLED)
         self._safe_update(update)
     
+    def _set_search_result(self, text: str, progressive: bool = False):
+        """设置检索结果文本
+        
+        经由结果输出组件写入，新的写入会取消尚未完成的分段填充；
+        多条文献格式化后的长文本可用 progressive 分段插入，避免一次性插入卡顿。
+        完整文本同时记录在 DualOutputFrame 中，读取结果时不依赖填充进度。
+        """
+        self._safe_update(lambda: self.search_dual_output.update_content(text, progressive=progressive))
+    
+    def _stream_document(self, file_path: str, file_type: str, check_cancel: Callable[[], bool]):
+        """流式提取文档文本
+        
+        解析在独立的生产者线程中进行，按页放入有界队列，
+        调用方边消费边处理，解析与后续工作可重叠且内存占用受限。
+        """
+        chunks: queue.Queue = queue.Queue(maxsize=4)
+        done = object()
+        
+        def producer():
+            try:
+                if file_type == "pdf":
+                    from parsers.pdf_parser import PDFParser
+                    for page_text in PDFParser().iter_pages(file_path):
+                        if check_cancel():
+                            break
+                        chunks.put(page_text)
+                else:
+                    from parsers.docx_parser import DocxParser
+                    chunks.put(DocxParser().parse(file_path))
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(done)
+        
+        threading.Thread(target=producer, daemon=True).start()
+        
+        while True:
+            item = chunks.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    
+    def _read_paper_text(
+        self,
+        file_path: str,
+        file_type: str,
+        check_cancel: Callable[[], bool],
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> Optional[str]:
+        """读取并解析论文文件文本（在工作线程中调用）
+        
+        结果按 (路径, 修改时间) 缓存，同一文件先诊断再优化时无需重复解析。
+        
+        Args:
+            file_path: 文件路径
+            file_type: 文件类型 (pdf/docx)
+            check_cancel: 取消检查函数
+            on_progress: 解析进度回调，参数为已提取字数
+            
+        Returns:
+            解析后的文本；任务被取消时返回 None
+        """
+        key = (file_path, os.path.getmtime(file_path))
+        with self._file_cache_lock:
+            if key in self._file_cache:
+                self._file_cache.move_to_end(key)
+                return self._file_cache[key]
+            # 同一文件正在被其他线程（如选择文件后的预解析）解析时，等待其结果而不重复解析
+            in_flight = self._file_parsing.get(key)
+            if in_flight is None:
+                self._file_parsing[key] = threading.Event()
+        
+        if in_flight is not None:
+            while not in_flight.wait(0.2):
+                if check_cancel():
+                    return None
+            return self._read_paper_text(file_path, file_type, check_cancel, on_progress)
+        
+        try:
+            parts = []
+            char_count = 0
+            for chunk in self._stream_document(file_path, file_type, check_cancel):
+                parts.append(chunk)
+                char_count += len(chunk)
+                if on_progress:
+                    on_progress(char_count)
+            if check_cancel():
+                return None
+            
+            text = "\n".join(parts)
+            with self._file_cache_lock:
+                self._file_cache[key] = text
+                while len(self._file_cache) > FILE_CACHE_SIZE:
+                    self._file_cache.popitem(last=False)
+            return text
+        finally:
+            with self._file_cache_lock:
+                self._file_parsing.pop(key).set()
+    
     def _run_diagnose(self):
         """运行诊断 - 支持批量处理 (P3)"""
         if not self._check_api_before_action("论文诊断"):
@@ -3174,10 +3601,7 @@ class EconPaperApp:
             # 文本模式，伪造一个列表以统一流程
             process_queue = [(None, text, None)]
         else:
-            process_queue = []
-            for fp in files_to_process:
-                f_type = "pdf" if fp.lower().endswith(".pdf") else "docx"
-                process_queue.append((fp, None, f_type))
+            process_queue = [(fp, None, f_type) for fp, f_type in self.diag_file_infos]
 
         self.diag_dual_output.clear()
         
@@ -3188,7 +3612,7 @@ class EconPaperApp:
             diagnostic = DiagnosticAgent()
             
             total_files = len(process_queue)
-            self._safe_update(lambda: self.precise_progress["diagnose"].start(total_files, "准备开始诊断..."))
+            self._safe_update(partial(self.precise_progress["diagnose"].start, total_files, "准备开始诊断..."))
             
             batch_results = []
             
@@ -3196,14 +3620,19 @@ class EconPaperApp:
                 if check_cancel(): return None
                 
                 fname = os.path.basename(f_path) if f_path else "粘贴的文本"
-                # 修复 Lambda 闭包陷阱：使用默认参数捕获当前值
-                self._safe_update(lambda idx=i, name=fname, total=total_files: self.precise_progress["diagnose"].update(idx, f"正在处理 ({idx}/{total}): {name}"))
+                self._safe_update(partial(self.precise_progress["diagnose"].update, i, f"正在处理 ({i}/{total_files}): {fname}"))
                 
                 try:
                     content = raw_text
                     if f_path:
-                        with open(f_path, "rb") as f:
-                            content = f.read()
+                        # 边解析边更新已提取字数
+                        content = self._read_paper_text(
+                            f_path, f_type, check_cancel,
+                            on_progress=lambda n: self._safe_update(
+                                partial(self.precise_progress["diagnose"].update, i, f"正在解析 {fname}: 已提取 {n} 字")
+                            )
+                        )
+                        if content is None: return None
                     
                     # 诊断单个文件
                     report = agent.diagnose_only(content, file_type=f_type)
@@ -3211,7 +3640,7 @@ class EconPaperApp:
                     
                     res_obj = {
                         'filename': fname,
-                        'content': content if isinstance(content, str) else f"（{fname} 文件内容已解析）",
+                        'content': f"（{fname} 文件内容已解析）" if f_path else content,
                         'report': f"### 文件: {fname}\n📊 评分: {report.overall_score:.1f}/10\n\n{formatted}"
                     }
                     batch_results.append(res_obj)
@@ -3231,17 +3660,13 @@ class EconPaperApp:
         
         def on_complete(results):
             if results:
-                # 汇总结果显示
-                all_reports = []
-                for r in results:
-                    all_reports.append(r['report'])
-                
-                summary = "\n\n" + "="*50 + "\n\n".join(all_reports)
+                # 汇总结果显示：各文件报告之间以分隔线隔开
+                summary = f"\n\n{'='*50}\n\n".join([r['report'] for r in results])
                 
                 if is_batch:
                     self.diag_dual_output.set_content(
                         f"已完成 {len(results)} 个文件的批量诊断。详细报告请查看「分析报告」选项卡。",
-                        f"# 批量诊断汇总报告\n\n" + summary
+                        "# 批量诊断汇总报告\n\n" + summary
                     )
                 else:
                     self.diag_dual_output.set_result(results[0])
@@ -3284,7 +3709,7 @@ class EconPaperApp:
             return
             
         # 批量文件处理流程
-        process_queue = [(fp, None, "pdf" if fp.lower().endswith(".pdf") else "docx") for fp in files_to_process]
+        process_queue = [(fp, None, f_type) for fp, f_type in self.opt_file_infos]
         
         sections = [k for k, v in self.opt_sections.items() if v.get()]
         if not sections:
@@ -3302,21 +3727,21 @@ class EconPaperApp:
             optimizer = OptimizerAgent(stage=stage)
             
             total_files = len(process_queue)
-            self._safe_update(lambda: self.precise_progress["optimize"].start(total_files, "开始批量优化..."))
+            self._safe_update(partial(self.precise_progress["optimize"].start, total_files, "开始批量优化..."))
             
             batch_results = []
             for idx, (f_path, raw_text, f_type) in enumerate(process_queue, 1):
                 if check_cancel(): return None
                 fname = os.path.basename(f_path) if f_path else "粘贴的文本"
-                # 修复 Lambda 闭包陷阱：使用默认参数捕获当前值
-                self._safe_update(lambda i=idx, name=fname, total=total_files: self.precise_progress["optimize"].update(i, f"优化中 ({i}/{total}): {name}"))
+                self._safe_update(partial(self.precise_progress["optimize"].update, idx, f"优化中 ({idx}/{total_files}): {fname}"))
                 
                 try:
                     content = raw_text
                     if f_path:
-                        with open(f_path, "rb") as f: content = f.read()
+                        content = self._read_paper_text(f_path, f_type, check_cancel)
+                        if content is None: return None
                     
-                    paper_structure = recognizer.recognize(content if isinstance(content, str) else f"（{fname} 内容已解析）")
+                    paper_structure = recognizer.recognize(content)
                     content_parts = []
                     
                     for s_idx, section in enumerate(sections):
@@ -3338,7 +3763,7 @@ class EconPaperApp:
                     # 保存历史
                     self.history.save_record(
                         action_type="optimize",
-                        input_content=content if isinstance(content, str) else f"File: {fname}",
+                        input_content=f"File: {fname}" if f_path else content,
                         output_content=final_content,
                         report=res_obj['report'],
                         metadata={'stage': stage, 'sections': sections}
@@ -3406,8 +3831,10 @@ class EconPaperApp:
             def combined_generator():
                 for i, s in enumerate(sections, 1):
                     # 更新进度条和报告区
-                    self._safe_update(lambda idx=i, sec=s: self.precise_progress["optimize"].update(idx, f"正在优化: {sec}"))
-                    self._safe_update(lambda sec=s: self.opt_dual_output.report_output.append_chunk(f"▶️ 正在优化章节: {sec}\n"))
+                    def mark_section(idx=i, sec=s):
+                        self.precise_progress["optimize"].update(idx, f"正在优化: {sec}")
+                        self.opt_dual_output.report_output.append_chunk(f"▶️ 正在优化章节: {sec}\n")
+                    self._safe_update(mark_section)
                     
                     yield f"\n## {s.upper()}\n\n"
                     yield from agent.optimize_single_section_stream(s, text, full_context)
@@ -3440,7 +3867,8 @@ class EconPaperApp:
             self.opt_dual_output.content_output.stream_from_generator(
                 combined_generator(),
                 on_complete=on_complete,
-                on_error=on_error
+                on_error=on_error,
+                runner=self.task_manager.run
             )
 
         process_sequential()
@@ -3463,24 +3891,20 @@ class EconPaperApp:
             process_queue = [(fp, None) for fp in files_to_process]
             
         strength = self.dedup_strength.get()
-        terms_str = self.dedup_terms.get().strip()
-        if "逗号分隔" in terms_str: terms_str = ""
-        terms = [t.strip() for t in terms_str.split(",") if t.strip()] if terms_str else None
+        terms = self._parse_terms()
         
         self.dedup_dual_output.clear()
         
         def do_batch_dedup(check_cancel):
-            from engines.dedup import DedupEngine
-            engine = DedupEngine()
+            engine = self._get_dedup_engine()
             total = len(process_queue)
-            self._safe_update(lambda: self.precise_progress["dedup"].start(total, "开始批量降重..."))
+            self._safe_update(partial(self.precise_progress["dedup"].start, total, "开始批量降重..."))
             
             batch_results = []
             for i, (f_path, raw_text) in enumerate(process_queue, 1):
                 if check_cancel(): return None
                 fname = os.path.basename(f_path) if f_path else "粘贴的文本"
-                # 修复 Lambda 闭包陷阱：使用默认参数捕获当前值
-                self._safe_update(lambda idx=i, name=fname, t=total: self.precise_progress["dedup"].update(idx, f"处理中 ({idx}/{t}): {name}"))
+                self._safe_update(partial(self.precise_progress["dedup"].update, i, f"处理中 ({i}/{total}): {fname}"))
                 
                 try:
                     content = raw_text
@@ -3531,22 +3955,49 @@ class EconPaperApp:
         self.is_processing = True
         self.task_manager.submit(do_batch_dedup, on_complete=on_complete, on_error=on_error, task_name="dedup")
     
+    def _clear_terms_placeholder(self, event=None):
+        """术语输入框获得焦点时清除占位提示"""
+        if self.dedup_terms.get() == DEDUP_TERMS_PLACEHOLDER:
+            self.dedup_terms.delete(0, tk.END)
+    
+    def _parse_terms(self) -> Optional[List[str]]:
+        """解析需保留的专业术语（逗号分隔，忽略占位提示文字）"""
+        terms_str = self.dedup_terms.get()
+        if terms_str == DEDUP_TERMS_PLACEHOLDER:
+            return None
+        terms = [t.strip() for t in _TERMS_RE.findall(terms_str)]
+        return [t for t in terms if t] or None
+    
+    def _get_dedup_engine(self):
+        """获取复用的降重引擎"""
+        if self._dedup_engine is None:
+            from engines.dedup import DedupEngine
+            self._dedup_engine = DedupEngine()
+        return self._dedup_engine
+    
+    def _get_deai_engine(self):
+        """获取复用的降AI引擎"""
+        if self._deai_engine is None:
+            from engines.deai import DeAIEngine
+            self._deai_engine = DeAIEngine()
+        return self._deai_engine
+    
     def _run_deai(self):
         """运行降AI"""
         if not self._check_api_before_action("降AI痕迹"):
             return
         
-        text = self.dedup_input.get("1.0", tk.END).strip()
-        if not text:
+        # 主线程只取原始文本，isspace 判空不产生副本，strip 在工作线程中完成
+        text = self.dedup_input_comp.get_content(strip=False)
+        if not text or text.isspace():
             self.notification.show("请输入文本", "warning")
             return
         
         self._set_result(self.dedup_output, "")
         
         def do_deai(check_cancel):
-            from engines.deai import DeAIEngine
-            engine = DeAIEngine()
-            result = engine.process(text)
+            engine = self._get_deai_engine()
+            result = engine.process(text.strip())
             if check_cancel(): return None
             report = engine.get_report(result)
             
@@ -3584,37 +4035,33 @@ class EconPaperApp:
         if not self._check_api_before_action("深度处理"):
             return
         
-        text = self.dedup_input.get("1.0", tk.END).strip()
-        if not text:
+        # 主线程只取原始文本，isspace 判空不产生副本，strip 在工作线程中完成
+        text = self.dedup_input_comp.get_content(strip=False)
+        if not text or text.isspace():
             self.notification.show("请输入文本", "warning")
             return
         
         strength = self.dedup_strength.get()
-        terms_str = self.dedup_terms.get().strip()
-        if "逗号分隔" in terms_str:
-            terms_str = ""
-        terms = [t.strip() for t in terms_str.split(",") if t.strip()] if terms_str else None
+        terms = self._parse_terms()
         
         self._set_result(self.dedup_output, "")
         
         def do_both(check_cancel):
-            from engines.dedup import DedupEngine
-            from engines.deai import DeAIEngine
-            
-            self._safe_update(lambda: self.precise_progress["dedup"].update(1, "第1步: 智能降重..."))
-            dedup_engine = DedupEngine()
-            dedup_result = dedup_engine.process(text, strength=int(strength), preserve_terms=terms)
+            self._safe_update(partial(self.precise_progress["dedup"].update, 1, "第1步: 智能降重..."))
+            dedup_engine = self._get_dedup_engine()
+            dedup_result = dedup_engine.process(text.strip(), strength=int(strength), preserve_terms=terms)
             
             if check_cancel(): return None
             
-            self._safe_update(lambda: self.precise_progress["dedup"].update(2, "第2步: 消除AI痕迹..."))
-            deai_engine = DeAIEngine()
+            self._safe_update(partial(self.precise_progress["dedup"].update, 2, "第2步: 消除AI痕迹..."))
+            deai_engine = self._get_deai_engine()
             deai_result = deai_engine.process(dedup_result.processed)
             
             if check_cancel(): return None
             
             # 返回结构化结果
             return {
+                'input': dedup_result.original,
                 'content': deai_result.processed,  # 最终处理结果
                 'report': f"""⚡ 深度处理报告
 
@@ -3640,7 +4087,7 @@ class EconPaperApp:
                 # 保存历史记录
                 self.history.save_record(
                     action_type="deep_process",
-                    input_content=text,
+                    input_content=res['input'],
                     output_content=res['content'],
                     report=res['report'],
                     metadata={'strength': strength, 'terms': terms}
@@ -3671,41 +4118,99 @@ class EconPaperApp:
             self.notification.show("请先输入初始关键词", "warning")
             return
         
-        self.progress_indicators["search"].start("AI正在扩展关键词...")
+        # 再次扩展时取消上一次尚未结束的扩展
+        self._cancel_expand_keywords()
+        
+        # 生成过程在报告选项卡中逐段追加显示，不反复重写结果区
+        report_output = self.search_dual_output.report_output
+        report_output.start_streaming("AI正在扩展关键词...")
+        self.search_dual_output.notebook.select(1)
+        
+        def append_delta(text):
+            # 已被取消或被新任务取代时丢弃迟到的文本
+            if self._expand_task == task_id:
+                report_output.append_chunk(text)
         
         def do_expand(check_cancel):
-            if OpenAI is None: raise ImportError("未安装 openai 库")
-            from config.settings import settings
-            client = OpenAI(base_url=settings.llm_api_base, api_key=settings.llm_api_key)
+            client = _llm_client()
             
             prompt = f"作为学术研究助手，请帮我扩展以下研究主题的关键词，用于文献检索。\n\n研究主题：{query}\n\n请提供：\n1. 中文关键词扩展\n2. 英文关键词扩展\n3. 推荐的搜索组合"
+            messages = [{"role": "user", "content": prompt}]
+            cache_key = llm_cache.make_key(settings.llm_model, messages, temperature=0.7)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
             
             response = client.chat.completions.create(
                 model=settings.llm_model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7
+                messages=messages,
+                temperature=0.7,
+                stream=True
             )
-            return response.choices[0].message.content
+            # 只投递新增部分，界面刷新节流到每 50ms 一次
+            parts = []
+            sent = 0
+            last_flush = 0.0
+            for chunk in response:
+                if check_cancel():
+                    response.close()
+                    return None
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    now = time.monotonic()
+                    if now - last_flush >= 0.05:
+                        last_flush = now
+                        self._safe_update(partial(append_delta, "".join(parts[sent:])))
+                        sent = len(parts)
+            
+            result = "".join(parts)
+            llm_cache.put(cache_key, result)
+            return result
         
         def on_complete(result):
+            # 完成回调已排队后任务才被取消/取代时同样丢弃
+            if self._expand_task != task_id:
+                return
+            self._expand_task = None
+            report_output.end_streaming(True)
+            # 完成时才读取结果区现有内容，期间的检索结果不会被旧内容覆盖
+            current_text = self.search_dual_output.get_content().strip()
+            header = f"{'='*30} 🤖 AI 关键词扩展建议 {'='*30}\n\n研究主题：{query}\n\n{result or ''}\n\n"
+            new_text = header + f"{'='*60}\n\n" + current_text if current_text else header
+            self.search_dual_output.update_content(new_text, progressive=True)
+            self._restore_search_report()
+            self.search_dual_output.notebook.select(0)
             self.notification.show("关键词扩展完成", "success")
-            # 将结果直接显示在搜索结果区，方便用户查看和复制
-            current_text = self.search_result.get("1.0", tk.END).strip()
-            header = f"{'='*30} 🤖 AI 关键词扩展建议 {'='*30}\n\n研究主题：{query}\n\n{result}\n\n"
-            if current_text:
-                new_text = header + f"{'='*60}\n\n" + current_text
-            else:
-                new_text = header
-            
-            self._set_result(self.search_result, new_text)
             self.progress_indicators["search"].stop()
             
         def on_error(err):
+            if self._expand_task != task_id:
+                return
+            self._expand_task = None
+            report_output.end_streaming(False)
+            self._restore_search_report()
             self.notification.show(f"AI扩展失败: {err}", "error")
             self.progress_indicators["search"].stop()
             
-        task_id = self.task_manager.submit(do_expand, on_complete=on_complete, on_error=on_error, task_name="expand_keywords")
-        self.progress_indicators["search"].start("AI正在扩展关键词...", on_cancel=lambda: self.task_manager.cancel(task_id))
+        task_id = self._expand_task = self.task_manager.submit(
+            do_expand, on_complete=on_complete, on_error=on_error, task_name="expand_keywords"
+        )
+        self.progress_indicators["search"].start("AI正在扩展关键词...", on_cancel=self._cancel_expand_keywords)
+    
+    def _cancel_expand_keywords(self):
+        """取消进行中的关键词扩展，报告选项卡恢复为检索报告"""
+        if self._expand_task is None:
+            return
+        self.task_manager.cancel(self._expand_task)
+        self._expand_task = None
+        self._restore_search_report()
+        self.progress_indicators["search"].stop()
+    
+    def _restore_search_report(self):
+        """报告选项卡恢复显示当前检索报告（关键词扩展流式显示结束后调用）"""
+        self.search_dual_output.report_output.set_content(
+            self.search_dual_output.get_report() or "暂无分析报告"
+        )
     
     def _run_search(self):
         """运行学术搜索 - v2.0 使用可靠的学术API"""
@@ -3727,55 +4232,82 @@ class EconPaperApp:
         except (ValueError, AttributeError):
             pass
         
-        self._set_result(self.search_result, "")
-        self._safe_update(lambda: self.search_status_label.config(text="搜索中..."))
+        # 新的检索开始后，进行中的关键词扩展不再写入结果区
+        self._cancel_expand_keywords()
+        self._set_search_result("")
+        self._safe_update(partial(self.search_status_label.config, text="搜索中..."))
         
         def do_search(check_cancel):
             all_results = []
             errors = []
             
-            # 搜索数据源
+            from knowledge.search.journal_rank import get_rank_fields
+            
+            def make_paper(**fields):
+                # 构建结果时直接附加期刊级别，无需再单独遍历一遍
+                fields['rank_info'], fields['journal_category'] = get_rank_fields(fields['journal'])
+                return fields
+            
+            def fetch_ss():
+                from knowledge.search.semantic_scholar import search_semantic_scholar
+                ss_results = _cached_search(search_semantic_scholar, query, limit=limit, year_from=year_from)
+                return [make_paper(title=r.title, authors=r.authors, year=r.year, abstract=r.abstract,
+                                   url=r.link, citations=r.citations, journal=r.venue, doi=r.doi,
+                                   source='Semantic Scholar') for r in ss_results]
+            
+            def fetch_oa():
+                from knowledge.search.openalex import search_openalex
+                oa_results = _cached_search(search_openalex, query, limit=limit, year_from=year_from)
+                return [make_paper(title=r.title, authors=r.authors, year=r.year, abstract=r.abstract,
+                                   url=r.link, citations=r.citations, journal=r.venue, doi=r.doi,
+                                   source='OpenAlex') for r in oa_results]
+            
+            def fetch_cnki():
+                from knowledge.search.cnki import search_cnki
+                cnki_results = _cached_search(search_cnki, query, limit=limit)
+                return [make_paper(title=r.title, authors=r.authors, year=r.year, abstract=r.abstract,
+                                   url=r.link, citations=r.citations, journal=r.source, doi='',
+                                   source=r.database) for r in cnki_results]
+            
+            # 搜索数据源: (错误前缀, 显示名, 检索函数)
+            fetchers = []
             if source in ["英文文献", "Semantic Scholar"]:
-                self._safe_update(lambda: self.progress_indicators["search"].update_text("正在搜索 Semantic Scholar..."))
-                try:
-                    from knowledge.search.semantic_scholar import search_semantic_scholar
-                    ss_results = search_semantic_scholar(query, limit=limit, year_from=year_from)
-                    all_results.extend([{'title': r.title, 'authors': r.authors, 'year': r.year, 'abstract': r.abstract,
-                                       'url': r.link, 'citations': r.citations, 'journal': r.venue, 'doi': r.doi,
-                                       'source': 'Semantic Scholar'} for r in ss_results])
-                except Exception as e: errors.append(f"SS: {e}")
-
-            if check_cancel(): return None
-
+                fetchers.append(("SS", "Semantic Scholar", fetch_ss))
             if source in ["英文文献", "OpenAlex"]:
-                self._safe_update(lambda: self.progress_indicators["search"].update_text("正在搜索 OpenAlex..."))
-                try:
-                    from knowledge.search.openalex import search_openalex
-                    oa_results = search_openalex(query, limit=limit, year_from=year_from)
-                    all_results.extend([{'title': r.title, 'authors': r.authors, 'year': r.year, 'abstract': r.abstract,
-                                       'url': r.link, 'citations': r.citations, 'journal': r.venue, 'doi': r.doi,
-                                       'source': 'OpenAlex'} for r in oa_results])
-                except Exception as e: errors.append(f"OA: {e}")
-
-            if check_cancel(): return None
-
+                fetchers.append(("OA", "OpenAlex", fetch_oa))
             if source in ["中文文献", "百度学术"]:
-                self._safe_update(lambda: self.progress_indicators["search"].update_text("正在搜索中文文献..."))
+                fetchers.append(("CNKI", "中文文献", fetch_cnki))
+            
+            source_results = {}
+            if len(fetchers) == 1:
+                tag, label, fetch = fetchers[0]
+                self._safe_update(partial(self.progress_indicators["search"].update_text, f"正在搜索 {label}..."))
                 try:
-                    from knowledge.search.cnki import search_cnki
-                    cnki_results = search_cnki(query, limit=limit)
-                    all_results.extend([{'title': r.title, 'authors': r.authors, 'year': r.year, 'abstract': r.abstract,
-                                       'url': r.link, 'citations': r.citations, 'journal': r.source, 'doi': '',
-                                       'source': r.database} for r in cnki_results])
-                except Exception as e: errors.append(f"CNKI: {e}")
+                    source_results[tag] = fetch()
+                except Exception as e: errors.append(f"{tag}: {e}")
+            elif fetchers:
+                # 各数据源均为网络 IO，并发请求，总耗时取决于最慢的一个
+                total = len(fetchers)
+                self._safe_update(partial(self.progress_indicators["search"].update_text, f"正在并行搜索 {total} 个数据源..."))
+                with ThreadPoolExecutor(max_workers=total, thread_name_prefix="search") as pool:
+                    futures = {pool.submit(fetch): tag for tag, _, fetch in fetchers}
+                    for done, future in enumerate(as_completed(futures), 1):
+                        tag = futures[future]
+                        try:
+                            source_results[tag] = future.result()
+                        except Exception as e: errors.append(f"{tag}: {e}")
+                        self._safe_update(partial(self.progress_indicators["search"].update_text, f"已完成 {done}/{total} 个数据源"))
+            
+            # 按数据源固定顺序合并，保证去重时的优先级与完成顺序无关
+            for tag, _, _ in fetchers:
+                all_results.extend(source_results.get(tag, []))
 
             if check_cancel(): return None
 
             # 筛选逻辑
             if all_results:
                 try:
-                    from knowledge.search.journal_rank import enrich_with_rank_info, filter_by_quality
-                    all_results = enrich_with_rank_info(all_results)
+                    from knowledge.search.journal_rank import filter_by_quality
                     if self.filter_cssci.get() or self.filter_ssci.get():
                         all_results = filter_by_quality(all_results, require_cssci=self.filter_cssci.get(), require_ssci=self.filter_ssci.get())
                 except: pass
@@ -3783,31 +4315,35 @@ class EconPaperApp:
             if not all_results:
                 return {"error": "未找到相关文献。\n\n" + "\n".join(errors)}
 
-            # 去重和排序
-            seen = set()
-            unique = []
+            # 去重和排序：按归一化标题保留首次出现的文献（dict 保持插入顺序）
+            unique_by_title = {}
             for p in all_results:
-                if p['title'].lower() not in seen:
-                    seen.add(p['title'].lower())
-                    unique.append(p)
+                unique_by_title.setdefault(_normalize_title(p['title']), p)
+            unique = list(unique_by_title.values())
             
             if check_cancel(): return None
             
             if enable_ai and len(unique) > limit:
-                self._safe_update(lambda: self.progress_indicators["search"].update_text("AI智能筛选中..."))
+                self._safe_update(partial(self.progress_indicators["search"].update_text, "AI智能筛选中..."))
                 unique = self._ai_filter_papers(query, unique, limit)
                 
-            unique.sort(key=lambda x: x.get('citations', 0) or 0, reverse=True)
+            for p in unique:
+                p['citations'] = p.get('citations') or 0
+            unique.sort(key=itemgetter('citations'), reverse=True)
             return unique
 
         def on_complete(results):
             if isinstance(results, dict) and "error" in results:
-                self._set_result(self.search_result, str(results["error"]))
+                self._set_search_result(str(results["error"]))
                 self.search_status_label.config(text="未找到结果")
             elif isinstance(results, list):
                 formatted = self._format_search_results(results, enable_ai)
                 # 使用 DualOutputFrame 显示结果
-                self.search_dual_output.set_content(formatted, f"🔍 搜索报告\n\n关键词: {query}\n数据源: {source}\n结果数量: {len(results)}")
+                self.search_dual_output.set_content(
+                    formatted,
+                    self._search_report(query, source, len(results)),
+                    progressive=True
+                )
                 
                 # 保存历史记录
                 self.history.save_record(
@@ -3820,13 +4356,19 @@ class EconPaperApp:
                 
                 self.search_status_label.config(text=f"共 {len(results)} 篇文献")
                 self.last_search_results = results
+                # 在后台持久化检索结果，下次启动可直接复用
+                saved = {"saved_at": time.time(), "query": query, "source": source, "results": results}
+                self.task_manager.submit(
+                    lambda check_cancel: self._save_ui_preference("last_search", saved),
+                    task_name="save_search"
+                )
                 self.notification.show("搜索完成", "success")
                 self.status_bar.set_status(f"搜索完成，找到 {len(results)} 篇文献", "success")
             self.precise_progress["search"].stop()
             self.is_processing = False
 
         def on_error(err):
-            self._set_result(self.search_result, f"搜索失败: {err}")
+            self._set_search_result(f"搜索失败: {err}")
             self.progress_indicators["search"].stop()
             self.is_processing = False
             
@@ -3844,27 +4386,46 @@ class EconPaperApp:
             self.notification.show("请先搜索文献", "warning")
             return
         
+        # 重新生成时取消上一次尚未结束的流
+        if self._review_cancel is not None:
+            self._review_cancel.set()
+        cancel = self._review_cancel = threading.Event()
+        
         def generate_stream():
-            if OpenAI is None: raise ImportError("未安装 openai 库")
-            from config.settings import settings
-            client = OpenAI(base_url=settings.llm_api_base, api_key=settings.llm_api_key)
+            client = _llm_client()
             
-            papers_text = ""
-            for i, p in enumerate(self.last_search_results[:15], 1):
-                papers_text += f"{i}. {p.get('title')} ({p.get('authors')}, {p.get('year')})\n摘要：{p.get('abstract', '')[:300]}\n\n"
+            papers_text = "".join([
+                f"{i}. {p.get('title')} ({p.get('authors')}, {p.get('year')})\n摘要：{(p.get('abstract') or '')[:300]}\n\n"
+                for i, p in enumerate(self.last_search_results[:15], 1)
+            ])
             
             prompt = f"请基于以下学术文献，生成一段学术论文风格的文献综述（约500-800字）。\n\n要求：1. 客观严谨 2. 归纳对比 3. 正确引用 4. 指出共识分歧\n\n文献列表：\n{papers_text}"
             
+            messages = [{"role": "user", "content": prompt}]
+            cache_key = llm_cache.make_key(settings.llm_model, messages, temperature=0.7, max_tokens=2000)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+            
             response = client.chat.completions.create(
                 model=settings.llm_model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 temperature=0.7,
                 max_tokens=2000,
                 stream=True
             )
+            parts = []
             for chunk in response:
+                if cancel.is_set():
+                    # 关闭连接，服务端停止继续生成
+                    response.close()
+                    return
                 if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
                     yield chunk.choices[0].delta.content
+            # 仅缓存完整生成的结果，中途取消的不写入
+            llm_cache.put(cache_key, "".join(parts))
         
         # 清空并准备流式输出到报告区
         current_content = self.search_dual_output.get_content()
@@ -3873,7 +4434,9 @@ class EconPaperApp:
         self.notebook.select(1) # 切换到报告页
         
         def on_complete(review):
-            if review:
+            if cancel.is_set():
+                self.status_bar.set_status("已取消生成文献综述", "warning")
+            elif review:
                 current_report = self.search_dual_output.get_report()
                 # 格式化最终报告
                 final_report = f"{'='*60}\n📝 AI 文献综述\n{'='*60}\n\n{review}\n\n{current_report}"
@@ -3886,7 +4449,7 @@ class EconPaperApp:
 
         def on_error(err):
             self.notification.show(f"生成失败: {err}", "error")
-            self.progress_indicators["search"].stop()
+            self.precise_progress["search"].stop(success=False)
             self.is_processing = False
             
         self.is_processing = True
@@ -3896,9 +4459,10 @@ class EconPaperApp:
         self.search_dual_output.report_output.stream_from_generator(
             generate_stream(),
             on_complete=on_complete,
-            on_error=on_error
+            on_error=on_error,
+            runner=self.task_manager.run
         )
-        self.precise_progress["search"].start(1, "正在生成文献综述...")
+        self.precise_progress["search"].start(1, "正在生成文献综述...", on_cancel=cancel.set)
     
     def _generate_citations(self):
         """生成引用格式"""
@@ -3925,7 +4489,7 @@ class EconPaperApp:
         tk.Label(
             content,
             text="选择引用格式",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_LG, "bold"),
+            font=ModernStyle.FONT_LG_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(anchor="w", pady=(0, 15))
         
@@ -3944,60 +4508,67 @@ class EconPaperApp:
                 variable=style_var,
                 value=value,
                 bg=ModernStyle.BG_MAIN,
-                font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+                font=ModernStyle.FONT_SM
             ).pack(anchor="w", pady=3)
         
         # 引用预览区
         tk.Label(
             content,
             text="引用预览：",
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, "bold"),
+            font=ModernStyle.FONT_MD_BOLD,
             bg=ModernStyle.BG_MAIN
         ).pack(anchor="w", pady=(20, 10))
         
         preview_text = scrolledtext.ScrolledText(
             content,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM),
+            font=ModernStyle.FONT_SM,
             height=15,
             wrap=tk.WORD,
             bg=ModernStyle.BG_SECONDARY
         )
         preview_text.pack(fill=tk.BOTH, expand=True)
         
+        # 文献字段只提取一次，切换格式时仅套用模板（各格式渲染结果缓存）
+        rows = []
+        for i, p in enumerate(self.last_search_results[:20], 1):
+            journal = p.get('journal', '')
+            doi = p.get('doi', '')
+            rows.append({
+                'i': i,
+                'authors': p.get('authors', '未知作者'),
+                'year': p.get('year', ''),
+                'title': p.get('title', '无标题'),
+                'journal': journal,
+                'apa_journal': f" {journal}." if journal else "",
+                'apa_doi': f" https://doi.org/{doi}" if doi else "",
+                'chicago_doi': f" https://doi.org/{doi}." if doi else "",
+            })
+        rendered: Dict[str, str] = {}
+        
         def update_preview(*args):
             style = style_var.get()
-            citations = []
-            
-            for i, p in enumerate(self.last_search_results[:20], 1):
-                authors = p.get('authors', '未知作者')
-                year = p.get('year', '')
-                title = p.get('title', '无标题')
-                journal = p.get('journal', '')
-                doi = p.get('doi', '')
-                
-                if style == "apa":
-                    cite = f"{authors} ({year}). {title}."
-                    if journal:
-                        cite += f" {journal}."
-                    if doi:
-                        cite += f" https://doi.org/{doi}"
-                elif style == "gb":
-                    cite = f"[{i}] {authors}. {title}[J]. {journal}, {year}."
-                elif style == "mla":
-                    cite = f'{authors}. "{title}." {journal}, {year}.'
-                elif style == "chicago":
-                    cite = f'{authors}. "{title}." {journal} ({year}).'
-                    if doi:
-                        cite += f" https://doi.org/{doi}."
-                else:
-                    cite = f"{authors} ({year}). {title}. {journal}."
-                
-                citations.append(cite)
+            text = rendered.get(style)
+            if text is None:
+                template = CITATION_TEMPLATES.get(style, CITATION_TEMPLATES["default"])
+                text = rendered[style] = "\n\n".join(map(template.format_map, rows))
             
             preview_text.delete("1.0", tk.END)
-            preview_text.insert("1.0", "\n\n".join(citations))
+            preview_text.insert("1.0", text)
+        
+        # 快速连续切换格式时只渲染最后一次
+        pending_preview = [None]
+        
+        def schedule_preview(*args):
+            if pending_preview[0] is not None:
+                cite_window.after_cancel(pending_preview[0])
+            pending_preview[0] = cite_window.after(50, run_preview)
         
-        style_var.trace("w", update_preview)
+        def run_preview():
+            pending_preview[0] = None
+            if preview_text.winfo_exists():
+                update_preview()
+        
+        style_var.trace_add("write", schedule_preview)
         update_preview()
         
         # 按钮
@@ -4067,17 +4638,13 @@ class EconPaperApp:
     def _ai_filter_papers(self, query: str, papers: list, top_k: int) -> list:
         """AI智能筛选文献"""
         try:
-            from openai import OpenAI
-            from config.settings import settings
-            
-            client = OpenAI(base_url=settings.llm_api_base, api_key=settings.llm_api_key)
+            client = _llm_client()
             
             # 构建文献摘要
-            papers_text = ""
-            for i, p in enumerate(papers[:30], 1):  # 最多30篇供筛选
-                title = p.get('title', '无标题')
-                abstract = p.get('abstract', p.get('snippet', '无摘要'))[:150]
-                papers_text += f"{i}. {title}\n   摘要：{abstract}\n\n"
+            papers_text = "".join([
+                f"{i}. {p.get('title', '无标题')}\n   摘要：{p.get('abstract', p.get('snippet', '无摘要'))[:150]}\n\n"
+                for i, p in enumerate(papers[:30], 1)  # 最多30篇供筛选
+            ])
             
             prompt = f"""作为学术研究助手，请从以下文献中筛选出与研究主题最相关的 {top_k} 篇。
 
@@ -4088,14 +4655,14 @@ class EconPaperApp:
 
 请仅返回最相关的文献序号（用逗号分隔，如：1,5,8），从最相关到较相关排序。"""
 
-            response = client.chat.completions.create(
+            content = llm_cache.complete(
+                client,
                 model=settings.llm_model,
                 messages=[{"role": "user", "content": prompt}],
+                cache_ttl=AI_FILTER_CACHE_TTL,
                 temperature=0.3,
                 max_tokens=100
             )
-            
-            content = response.choices[0].message.content
             if content is None:
                 return papers[:top_k]
             selected = content.strip()
@@ -4157,9 +4724,7 @@ class EconPaperApp:
             return
         
         def do_recommend(check_cancel):
-            if OpenAI is None: raise ImportError("未安装 openai 库")
-            from config.settings import settings
-            client = OpenAI(base_url=settings.llm_api_base, api_key=settings.llm_api_key)
+            client = _llm_client()
             
             prompt = f"请分析以下论文内容，提取3-5个核心研究关键词用于文献检索：\n\n{content[:2000]}\n\n仅返回关键词，逗号分隔。"
             response = client.chat.completions.create(
@@ -4172,10 +4737,12 @@ class EconPaperApp:
         
         def on_complete(keywords):
             if keywords:
+                # 先切换（必要时构建）检索页，再填入关键词
+                self._show_page("search")
                 self.search_query.delete(0, tk.END)
                 self.search_query.insert(0, keywords.strip())
-                self._show_page("search")
-                self.root.after(500, self._run_search)
+                # 页面切换是同步完成的，空闲时即可开始搜索
+                self.root.after_idle(self._run_search)
             self.progress_indicators["diagnose"].stop()
             self.is_processing = False
 
@@ -4190,15 +4757,13 @@ class EconPaperApp:
     
     def _find_supporting_literature(self):
         """根据审稿意见找支撑文献"""
-        comments = self.rev_comments.get("1.0", tk.END).strip()
+        comments = self.rev_comments_comp.get_content()
         if not comments:
             self.notification.show("请先输入审稿意见", "warning")
             return
         
         def do_find(check_cancel):
-            if OpenAI is None: raise ImportError("未安装 openai 库")
-            from config.settings import settings
-            client = OpenAI(base_url=settings.llm_api_base, api_key=settings.llm_api_key)
+            client = _llm_client()
             
             prompt = f"请分析以下审稿意见，提取关键词用于查找支撑文献：\n\n{comments[:1500]}\n\n仅返回关键词，逗号分隔。"
             response = client.chat.completions.create(
@@ -4211,10 +4776,12 @@ class EconPaperApp:
         
         def on_complete(keywords):
             if keywords:
+                # 先切换（必要时构建）检索页，再填入关键词
+                self._show_page("search")
                 self.search_query.delete(0, tk.END)
                 self.search_query.insert(0, keywords.strip())
-                self._show_page("search")
-                self.root.after(500, self._run_search)
+                # 页面切换是同步完成的，空闲时即可开始搜索
+                self.root.after_idle(self._run_search)
             self.progress_indicators["revision"].stop()
             self.is_processing = False
 
@@ -4232,12 +4799,12 @@ class EconPaperApp:
         if not self._check_api_before_action("退修助手"):
             return
         
-        comments = self.rev_comments.get("1.0", tk.END).strip()
+        comments = self.rev_comments_comp.get_content()
         if not comments:
             self.notification.show("请粘贴审稿意见", "warning")
             return
         
-        summary = self.rev_summary.get("1.0", tk.END).strip() or None
+        summary = self.rev_summary_comp.get_content() or None
         
         self.rev_dual_output.clear()
         self.is_processing = True
@@ -4251,7 +4818,7 @@ class EconPaperApp:
         self.precise_progress["revision"].start(2, "正在解析审稿意见...")
         
         def on_complete(final_letter):
-            self._safe_update(lambda: self.precise_progress["revision"].update(1, "生成建议信完成，正在生成分析报告..."))
+            self._safe_update(partial(self.precise_progress["revision"].update, 1, "生成建议信完成，正在生成分析报告..."))
             # 核心内容（回复信）生成完成后，启动后台任务生成分析报告
             def get_report_task(check_cancel):
                 return agent.process_comments(comments, summary)
@@ -4297,28 +4864,77 @@ class EconPaperApp:
         self.rev_dual_output.content_output.stream_from_generator(
             agent.process_comments_stream(comments, summary),
             on_complete=on_complete,
-            on_error=on_error
+            on_error=on_error,
+            runner=self.task_manager.run
         )
     
+    @staticmethod
+    def _env_file_mtime() -> Optional[float]:
+        """返回 .env 的修改时间，文件不存在时返回 None"""
+        try:
+            return (BASE_DIR / ".env").stat().st_mtime
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _set_entry(entry: tk.Entry, value: str):
+        """设置输入框内容，内容相同时不触发删除/插入和重绘"""
+        if entry.get() != value:
+            entry.delete(0, tk.END)
+            entry.insert(0, value)
+    
+    def _env_file_digest(self) -> Optional[bytes]:
+        """返回 .env 内容摘要；文件自上次记录后未被修改时直接使用缓存，不读取文件"""
+        mtime = self._env_file_mtime()
+        if mtime is None:
+            return None
+        if self._env_digest is None or self._env_digest[0] != mtime:
+            try:
+                data = (BASE_DIR / ".env").read_bytes()
+            except OSError:
+                return None
+            self._env_digest = (mtime, hashlib.blake2b(data, digest_size=16).digest())
+        return self._env_digest[1]
+    
+    def _refresh_settings_if_changed(self):
+        """.env 在上次读取后被修改过时才重新解析，否则直接复用已加载的配置"""
+        mtime = self._env_file_mtime()
+        if mtime is not None and mtime != self._env_mtime:
+            self._reload_env_settings()
+    
+    def _reload_env_settings(self):
+        """重新读取 .env 并切换到新的配置
+        
+        按旧地址/密钥创建的客户端随之丢弃，之后的请求使用新配置；
+        缓存键不含接口地址，旧服务商的缓存结果一并清空；
+        仅在对应模块已加载时重置其单例，不额外导入 openai。
+        """
+        self._env_mtime = self._env_file_mtime()
+        reload_settings(str(BASE_DIR / ".env"))
+        _get_openai_client.cache_clear()
+        _models_list_cache.clear()
+        llm_cache.clear()
+        if "core.llm" in sys.modules:
+            sys.modules["core.llm"].reset_llm_client()
+        if "core.embeddings" in sys.modules:
+            sys.modules["core.embeddings"].reset_embedding_client()
+    
+    # 设置页输入框与配置项的对应关系：(控件属性, 配置属性, 默认值)
+    _SETTING_FIELDS = (
+        ("setting_llm_base", "llm_api_base", ""),
+        ("setting_llm_key", "llm_api_key", ""),
+        ("setting_llm_model", "llm_model", "gpt-4o-mini"),
+        ("setting_embed_base", "embedding_api_base", ""),
+        ("setting_embed_key", "embedding_api_key", ""),
+        ("setting_embed_model", "embedding_model", "text-embedding-3-small"),
+    )
+    
     def _load_settings(self):
         """加载设置"""
         try:
-            from config.settings import settings
-            self.setting_llm_base.delete(0, tk.END)
-            self.setting_llm_base.insert(0, settings.llm_api_base or "")
-            self.setting_llm_key.delete(0, tk.END)
-            self.setting_llm_key.insert(0, settings.llm_api_key or "")
-            self.setting_llm_model.set(settings.llm_model or "gpt-4o-mini")
-            
-            # 安全访问嵌入模型配置控件
-            if hasattr(self, 'setting_embed_base') and hasattr(self.setting_embed_base, 'winfo_exists') and self.setting_embed_base.winfo_exists():
-                self.setting_embed_base.delete(0, tk.END)
-                self.setting_embed_base.insert(0, settings.embedding_api_base or "")
-            if hasattr(self, 'setting_embed_key') and hasattr(self.setting_embed_key, 'winfo_exists') and self.setting_embed_key.winfo_exists():
-                self.setting_embed_key.delete(0, tk.END)
-                self.setting_embed_key.insert(0, settings.embedding_api_key or "")
-            if hasattr(self, 'setting_embed_model'):
-                self.setting_embed_model.set(settings.embedding_model or "text-embedding-3-small")
+            self._refresh_settings_if_changed()
+            for widget_attr, setting_attr, default in self._SETTING_FIELDS:
+                self._set_entry(getattr(self, widget_attr), getattr(settings, setting_attr) or default)
             
             if settings.llm_api_key:
                 self.llm_status.config(text="● 已配置", fg=ModernStyle.SUCCESS)
@@ -4328,42 +4944,57 @@ class EconPaperApp:
 
     def _save_settings(self):
         """保存设置"""
+        # 完整保存已包含模型名称，无需再执行待处理的静默保存
+        if self._silent_save_job is not None:
+            self.root.after_cancel(self._silent_save_job)
+            self._silent_save_job = None
         try:
             env_path = BASE_DIR / ".env"
             
+            # 每个输入框只读取一次，后续复用局部变量
+            llm_base = self.setting_llm_base.get()
+            llm_key = self.setting_llm_key.get()
+            llm_model = self.setting_llm_model.get()
+            embed_model = self.setting_embed_model.get()
+            
             if self.use_same_api.get():
-                embed_base = self.setting_llm_base.get()
-                embed_key = self.setting_llm_key.get()
+                embed_base = llm_base
+                embed_key = llm_key
             else:
-                # 安全访问嵌入模型配置控件
-                embed_base = self.setting_embed_base.get() if (hasattr(self, 'setting_embed_base') and hasattr(self.setting_embed_base, 'winfo_exists') and self.setting_embed_base.winfo_exists()) else self.setting_llm_base.get()
-                embed_key = self.setting_embed_key.get() if (hasattr(self, 'setting_embed_key') and hasattr(self.setting_embed_key, 'winfo_exists') and self.setting_embed_key.winfo_exists()) else self.setting_llm_key.get()
+                embed_base = self.setting_embed_base.get()
+                embed_key = self.setting_embed_key.get()
             
             # 获取存储目录配置
-            data_dir = self.setting_data_dir.get().strip() if hasattr(self, 'setting_data_dir') else ""
-            workspace_dir = self.setting_workspace_dir.get().strip() if hasattr(self, 'setting_workspace_dir') else ""
+            data_dir = self.setting_data_dir.get().strip()
+            workspace_dir = self.setting_workspace_dir.get().strip()
             
-            lines = [
-                f"# EconPaper Pro 配置",
-                f"",
-                f"# 语言模型 (LLM) 配置",
-                f"LLM_API_BASE={self.setting_llm_base.get()}",
-                f"LLM_API_KEY={self.setting_llm_key.get()}",
-                f"LLM_MODEL={self.setting_llm_model.get()}",
-                f"",
-                f"# 嵌入模型 (Embedding) 配置",
-                f"EMBEDDING_API_BASE={embed_base}",
-                f"EMBEDDING_API_KEY={embed_key}",
-                f"EMBEDDING_MODEL={self.setting_embed_model.get()}",
-                f"",
-                f"# 存储目录配置 (避免占用C盘)",
-                f"DATA_DIR={data_dir}",
-                f"WORKSPACE_DIR={workspace_dir}",
-            ]
+            content = (
+                "# EconPaper Pro 配置\n"
+                "\n"
+                "# 语言模型 (LLM) 配置\n"
+                f"LLM_API_BASE={llm_base}\n"
+                f"LLM_API_KEY={llm_key}\n"
+                f"LLM_MODEL={llm_model}\n"
+                "\n"
+                "# 嵌入模型 (Embedding) 配置\n"
+                f"EMBEDDING_API_BASE={embed_base}\n"
+                f"EMBEDDING_API_KEY={embed_key}\n"
+                f"EMBEDDING_MODEL={embed_model}\n"
+                "\n"
+                "# 存储目录配置 (避免占用C盘)\n"
+                f"DATA_DIR={data_dir}\n"
+                f"WORKSPACE_DIR={workspace_dir}"
+            )
             
-            with open(env_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
+            # 内容未变化时不重写文件，保持修改时间不变，避免下次打开设置页时重新解析
+            digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+            if digest != self._env_file_digest():
+                _atomic_write_text(env_path, content)
+                self._env_digest = (self._env_file_mtime(), digest)
             
+            # 保存后立即生效：重新读取配置并丢弃按旧密钥/地址创建的客户端
+            self._reload_env_settings()
+            self.api_configured = bool(settings.llm_api_key and settings.llm_api_base)
             self.llm_status.config(text="● 已配置", fg=ModernStyle.SUCCESS)
             self.notification.show("配置已保存！部分设置重启生效。", "success")
             
@@ -4375,15 +5006,26 @@ def main():
     """主函数"""
     root = tk.Tk()
     
-    # 设置 DPI 感知（Windows）
-    try:
+    # 设置 DPI 感知（仅 Windows）
+    if sys.platform == "win32":
         from ctypes import windll
-        windll.shcore.SetProcessDpiAwareness(1)
-    except Exception:
-        pass
+        try:
+            windll.shcore.SetProcessDpiAwareness(1)
+        except (AttributeError, OSError):
+            # Windows 8.1 之前没有 shcore
+            pass
     
     app = EconPaperApp(root)
     root.mainloop()
+    
+    # 线程池工作线程在解释器退出时会被等待，窗口关闭后仍在进行的网络请求/流式生成
+    # 无法中断；设置与历史记录均已即时写入，刷新输出后直接结束进程
+    logging.shutdown()
+    for stream in (sys.stdout, sys.stderr):
+        # pythonw 启动时没有控制台，标准输出为 None
+        if stream is not None:
+            stream.flush()
+    os._exit(0)
 
 
 if __name__ == "__main__":